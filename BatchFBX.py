@@ -9,12 +9,994 @@ bl_info = {
 }
 
 import bpy
+import math
 import os
+import time
 from bpy.props import (
     StringProperty, BoolProperty, EnumProperty,
-    FloatProperty, CollectionProperty
+    FloatProperty, IntProperty, CollectionProperty
 )
 from bpy.types import Operator, Panel, PropertyGroup
+from mathutils import Matrix, Vector
+from . import Instrumentation
+
+
+# ----------------------------
+# Export Helpers
+# ----------------------------
+VRCHAT_FBX_SETTINGS = dict(
+    object_types={'MESH'},
+    apply_scale_options='FBX_SCALE_UNITS',
+    add_leaf_bones=False,
+    bake_anim_use_all_bones=False,
+    bake_anim_use_nla_strips=False,
+    bake_anim_use_all_actions=False,
+    use_custom_props=False,
+    mesh_smooth_type='OFF'
+)
+
+
+EXPORT_COLLECTION_NAME = "BatchFBX_Export"
+
+
+def get_export_collection():
+    """Scratch collection, not linked to any scene, that scopes the FBX exporter."""
+    collection = bpy.data.collections.get(EXPORT_COLLECTION_NAME)
+    if collection is None:
+        collection = bpy.data.collections.new(EXPORT_COLLECTION_NAME)
+    return collection
+
+
+def remove_export_collection():
+    collection = bpy.data.collections.get(EXPORT_COLLECTION_NAME)
+    if collection is not None:
+        bpy.data.collections.remove(collection)
+
+
+def export_objects(objects, filepath, export_mode, at_origin=False, cache_size=0):
+    """Export objects into one FBX file with the VRChat or Default preset.
+
+    The exporter is pointed at the scratch collection instead of the selection,
+    so the cost does not grow with scene size and the user's selection and
+    active object are left untouched. at_origin exports every object with an
+    identity transform. A cache_size above 0 exports vertex-cache optimized
+    stand-ins instead, see optimized_stand_ins().
+    """
+    collection = get_export_collection()
+    settings = dict(VRCHAT_FBX_SETTINGS) if export_mode == 'VRCHAT' else {}
+    stand_ins = None
+    renamed = []
+    matrices = []
+    try:
+        if cache_size:
+            with Instrumentation.phase("optimize"):
+                stand_ins, objects = optimized_stand_ins(objects, cache_size, renamed)
+            # Modifiers are already applied to the optimized meshes.
+            settings["use_mesh_modifiers"] = False
+
+        for obj in objects:
+            collection.objects.link(obj)
+            if at_origin:
+                matrices.append((obj, obj.matrix_world.copy()))
+                obj.matrix_world = Matrix.Identity(4)
+        bpy.ops.export_scene.fbx(filepath=filepath, collection=collection.name, **settings)
+    finally:
+        for obj in objects:
+            if obj.name in collection.objects:
+                collection.objects.unlink(obj)
+        for obj, matrix in matrices:
+            obj.matrix_world = matrix
+        remove_temp_objects(stand_ins)
+        for obj, name in renamed:
+            obj.name = name
+
+
+def export_object(obj, filepath, export_mode, at_origin=False, cache_size=0):
+    export_objects([obj], filepath, export_mode, at_origin, cache_size)
+
+
+def export_entry(stem, objects, path, export_mode, at_origin=False, lods=None, cache_size=0):
+    """Write the file(s) of one export entry.
+
+    objects is the entry's object, or its LOD0..N copies when lods is set.
+    Returns the file names written.
+    """
+    files = output_files(stem, lods)
+    if len(files) == 1:
+        export_objects(objects, os.path.join(path, files[0]), export_mode, at_origin, cache_size)
+    else:
+        for obj, name in zip(objects, files):
+            export_object(obj, os.path.join(path, name), export_mode, at_origin, cache_size)
+    return files
+
+
+# ----------------------------
+# LOD Generation
+# ----------------------------
+LOD_COLLECTION_NAME = "BatchFBX_LOD"
+# ID property on a temporary collection: {temporary name: original name} of
+# objects renamed to free a name the temporary objects need.
+RENAMED_KEY = "batchfbx_renamed"
+
+
+def lod_settings(props):
+    """LOD settings of the BatchFBX properties, or None when LODs are off."""
+    if not props.generate_lods:
+        return None
+    return {"levels": props.lod_levels, "ratio": props.lod_ratio, "combined": props.lod_combined}
+
+
+def output_files(stem, lods=None):
+    if lods is None or lods["combined"]:
+        return [f"{stem}.fbx"]
+    return [f"{stem}_LOD{level}.fbx" for level in range(lods["levels"] + 1)]
+
+
+def build_lods(context, entries, lods):
+    """Create LOD0..N copies of the entries' objects in a temporary scene collection.
+
+    Copies share the source mesh and get a Decimate modifier keeping
+    ratio ** level of the faces, so one depsgraph evaluation builds every
+    level of every object, with Blender evaluating objects in parallel.
+    Copies are named {stem}_LODn for Unity's LOD group import; other objects
+    already using such a name are renamed until remove_temp_objects() runs.
+    Returns (collection, {object name: [LOD0..N copies]}); pass the collection
+    to remove_temp_objects() when done.
+    """
+    collection = bpy.data.collections.new(LOD_COLLECTION_NAME)
+    context.scene.collection.children.link(collection)
+
+    copies = {}
+    renamed = {}
+    try:
+        for stem, obj in entries:
+            chain = []
+            for level in range(lods["levels"] + 1):
+                name = f"{stem}_LOD{level}"
+                existing = bpy.data.objects.get(name)
+                if existing is not None:
+                    existing.name = "BatchFBX_Renamed"
+                    renamed[existing.name] = name
+                    collection[RENAMED_KEY] = renamed
+                copy = obj.copy()
+                copy.name = name
+                if level:
+                    modifier = copy.modifiers.new("BatchFBX_LOD", 'DECIMATE')
+                    modifier.ratio = lods["ratio"] ** level
+                collection.objects.link(copy)
+                chain.append(copy)
+            copies[obj.name] = chain
+
+        # Evaluate all copies together; the exporter reuses the evaluated meshes.
+        context.evaluated_depsgraph_get()
+    except Exception:
+        remove_temp_objects(collection)
+        raise
+    return collection, copies
+
+
+# ----------------------------
+# Vertex Cache Optimization
+# ----------------------------
+OPTIMIZE_COLLECTION_NAME = "BatchFBX_Optimized"
+
+# (ACMR before, ACMR after) per exported object name, filled by optimized exports.
+cache_reports = {}
+
+# foreach_get field, width and buffer dtype per attribute data type.
+_ATTRIBUTE_FIELDS = {
+    'FLOAT': ("value", 1, "float32"),
+    'INT': ("value", 1, "int32"),
+    'INT8': ("value", 1, "int32"),
+    'BOOLEAN': ("value", 1, "bool"),
+    'FLOAT2': ("vector", 2, "float32"),
+    'INT32_2D': ("value", 2, "int32"),
+    'FLOAT_VECTOR': ("vector", 3, "float32"),
+    'FLOAT_COLOR': ("color", 4, "float32"),
+    'BYTE_COLOR': ("color", 4, "float32"),
+    'QUATERNION': ("value", 4, "float32"),
+}
+
+
+def acmr(corners, cache_size):
+    """Average cache miss ratio (misses per triangle) of a triangle index list on a FIFO cache."""
+    import collections
+    if len(corners) < 3:
+        return 0.0
+    cache = collections.deque()
+    cached = set()
+    misses = 0
+    for v in corners.tolist():
+        if v not in cached:
+            misses += 1
+            cache.append(v)
+            cached.add(v)
+            if len(cache) > cache_size:
+                cached.discard(cache.popleft())
+    return misses / max(1, len(corners) // 3)
+
+
+def tipsify(corners, n_verts, cache_size):
+    """Triangle order for a vertex cache of cache_size (Sander et al., "Fast Triangle Reordering", 2007).
+
+    Fans out around one vertex at a time and moves on to the neighbour that
+    is still in the cache with the most triangles left. corners is the flat
+    triangle index list; returns the new order as triangle indices.
+    """
+    import numpy as np
+    n_tris = len(corners) // 3
+    if n_verts == 0 or n_tris == 0:
+        return np.arange(n_tris, dtype=np.int64)
+    valence = np.bincount(corners, minlength=n_verts)
+    # Vertex-to-triangle adjacency in CSR form.
+    offsets = np.concatenate(([0], np.cumsum(valence))).tolist()
+    adjacency = (np.argsort(corners, kind='stable') // 3).tolist()
+    live = valence.tolist()
+    tri_verts = corners.tolist()
+    cache_time = [0] * n_verts
+    emitted = bytearray(n_tris)
+    dead_end = []
+    order = []
+    stamp = cache_size + 1
+    cursor = 0
+    fan = 0
+    while fan >= 0:
+        candidates = []
+        for t in adjacency[offsets[fan]:offsets[fan + 1]]:
+            if emitted[t]:
+                continue
+            emitted[t] = 1
+            order.append(t)
+            for v in tri_verts[3 * t:3 * t + 3]:
+                dead_end.append(v)
+                candidates.append(v)
+                live[v] -= 1
+                if stamp - cache_time[v] > cache_size:
+                    cache_time[v] = stamp
+                    stamp += 1
+
+        fan = -1
+        best = -1
+        for v in candidates:
+            if live[v] > 0:
+                priority = 0
+                if stamp - cache_time[v] + 2 * live[v] <= cache_size:
+                    priority = stamp - cache_time[v]
+                if priority > best:
+                    best = priority
+                    fan = v
+        if fan < 0:
+            while dead_end:
+                v = dead_end.pop()
+                if live[v] > 0:
+                    fan = v
+                    break
+        if fan < 0:
+            while cursor < n_verts and live[cursor] == 0:
+                cursor += 1
+            if cursor < n_verts:
+                fan = cursor
+    return np.array(order, dtype=np.int64)
+
+
+def _copy_attributes(source, mesh, orders):
+    """Copy the generic attributes of source to mesh, permuted by the index array per domain."""
+    import numpy as np
+    for attribute in source.attributes:
+        order = orders.get(attribute.domain)
+        field = _ATTRIBUTE_FIELDS.get(attribute.data_type)
+        if order is None or field is None or attribute.name.startswith("."):
+            continue
+        key, width, dtype = field
+        values = np.empty(len(attribute.data) * width, dtype=dtype)
+        attribute.data.foreach_get(key, values)
+        target = mesh.attributes.get(attribute.name)
+        if target is None:
+            target = mesh.attributes.new(attribute.name, attribute.data_type, attribute.domain)
+        target.data.foreach_set(key, values.reshape(-1, width)[order].ravel())
+
+
+def optimized_mesh(obj, depsgraph, cache_size):
+    """Triangulated copy of the evaluated mesh of obj, ordered for the GPU vertex cache.
+
+    Triangles are put in Tipsify order, then vertices in order of first use
+    (vertex-fetch order). Attributes, UVs, materials and normals are carried over.
+    Returns (mesh, ACMR before, ACMR after).
+    """
+    import numpy as np
+    source = bpy.data.meshes.new_from_object(obj.evaluated_get(depsgraph), preserve_all_data_layers=True,
+                                             depsgraph=depsgraph)
+    try:
+        n_verts, n_loops = len(source.vertices), len(source.loops)
+        source.calc_loop_triangles()
+        n_tris = len(source.loop_triangles)
+        tri_loops = np.empty(n_tris * 3, dtype=np.int64)
+        source.loop_triangles.foreach_get("loops", tri_loops)
+        tri_faces = np.empty(n_tris, dtype=np.int64)
+        source.loop_triangles.foreach_get("polygon_index", tri_faces)
+        loop_verts = np.empty(n_loops, dtype=np.int64)
+        source.loops.foreach_get("vertex_index", loop_verts)
+        normals = np.empty(n_loops * 3, dtype=np.float32)
+        source.corner_normals.foreach_get("vector", normals)
+
+        before = acmr(loop_verts[tri_loops], cache_size)
+        tri_order = tipsify(loop_verts[tri_loops], n_verts, cache_size)
+        corner_source = tri_loops.reshape(-1, 3)[tri_order].ravel()
+        face_source = tri_faces[tri_order]
+        corners = loop_verts[corner_source]
+
+        # Vertices in order of first use, unused ones last.
+        _, first_use = np.unique(corners, return_index=True)
+        used = corners[np.sort(first_use)]
+        unused = np.setdiff1d(np.arange(n_verts), used, assume_unique=True)
+        vert_order = np.concatenate([used, unused])
+        remap = np.empty(n_verts, dtype=np.int64)
+        remap[vert_order] = np.arange(n_verts)
+        corners = remap[corners]
+
+        mesh = bpy.data.meshes.new(source.name)
+        mesh.vertices.add(n_verts)
+        mesh.loops.add(len(corners))
+        mesh.loops.foreach_set("vertex_index", corners.astype(np.int32))
+        mesh.polygons.add(n_tris)
+        mesh.polygons.foreach_set("loop_start", np.arange(0, len(corners), 3, dtype=np.int32))
+        _copy_attributes(source, mesh, {'POINT': vert_order, 'CORNER': corner_source, 'FACE': face_source})
+        mesh.update(calc_edges=True)
+
+        for material in source.materials:
+            mesh.materials.append(material)
+        if source.uv_layers.active is not None:
+            mesh.uv_layers.active = mesh.uv_layers[source.uv_layers.active.name]
+        mesh.normals_split_custom_set(normals.reshape(-1, 3)[corner_source])
+        return mesh, before, acmr(corners, cache_size)
+    finally:
+        bpy.data.meshes.remove(source)
+
+
+def cache_setting(props):
+    """Vertex cache size to optimize for, or 0 when optimization is off."""
+    return props.cache_size if props.optimize_cache else 0
+
+
+def entry_cache_reports(objects):
+    return {obj.name: list(cache_reports[obj.name]) for obj in objects if obj.name in cache_reports}
+
+
+def optimized_stand_ins(objects, cache_size, renamed):
+    """Temporary objects carrying optimized copies of the objects' evaluated meshes.
+
+    Stand-ins have the source's transform and materials but no modifiers, so
+    nothing is evaluated twice, and are linked to a temporary scene collection.
+    They take over the source's name, which matters for the FBX and Unity's
+    _LODn import; sources are renamed meanwhile and appended to renamed as
+    (object, name) so the caller can restore them. Returns (collection, stand-ins).
+    """
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    collection = bpy.data.collections.new(OPTIMIZE_COLLECTION_NAME)
+    bpy.context.scene.collection.children.link(collection)
+    stand_ins = []
+    try:
+        for obj in objects:
+            mesh, before, after = optimized_mesh(obj, depsgraph, cache_size)
+            name = obj.name
+            cache_reports[name] = (before, after)
+            renamed.append((obj, name))
+            obj.name = "BatchFBX_Source"
+            stand_in = bpy.data.objects.new(name, mesh)
+            collection.objects.link(stand_in)
+            stand_in.matrix_world = obj.matrix_world
+            for slot, source_slot in zip(stand_in.material_slots, obj.material_slots):
+                if source_slot.link == 'OBJECT':
+                    slot.link = 'OBJECT'
+                    slot.material = source_slot.material
+            stand_ins.append(stand_in)
+    except Exception:
+        remove_temp_objects(collection)
+        raise
+    return collection, stand_ins
+
+
+def format_cache_reports(reports):
+    """One line per object and the average over all objects."""
+    lines = [f"{name}: ACMR {before:.3f} -> {after:.3f}" for name, (before, after) in sorted(reports.items())]
+    if reports:
+        before = sum(b for b, a in reports.values()) / len(reports)
+        after = sum(a for b, a in reports.values()) / len(reports)
+        lines.append(f"Average ACMR {before:.3f} -> {after:.3f}")
+    return lines
+
+
+def remove_temp_objects(collection):
+    """Delete a temporary collection with its objects and the meshes only they used.
+
+    Objects renamed to make way for the temporary ones get their names back.
+    """
+    if collection is None:
+        return
+    renamed = collection[RENAMED_KEY].to_dict() if RENAMED_KEY in collection else {}
+    for obj in list(collection.objects):
+        mesh = obj.data
+        bpy.data.objects.remove(obj)
+        if mesh is not None and mesh.users == 0:
+            bpy.data.meshes.remove(mesh)
+    bpy.data.collections.remove(collection)
+    for temp_name, name in renamed.items():
+        obj = bpy.data.objects.get(temp_name)
+        if obj is not None:
+            obj.name = name
+
+
+
+# ----------------------------
+# Static Batching
+# ----------------------------
+STATIC_BATCH_COLLECTION_NAME = "BatchFBX_StaticBatch"
+STATIC_BATCH_REPORT_NAME = "batchfbx_static_batch.json"
+
+
+def material_set(obj):
+    return tuple(sorted({slot.material.name for slot in obj.material_slots if slot.material}))
+
+
+def static_batch_groups(objects, cell_size):
+    """Group objects by material set and by the grid cell of their bounding box center.
+
+    A cell_size of 0 puts all objects with the same materials in one group.
+    Returns {(materials, cell): objects}.
+    """
+    groups = {}
+    for obj in objects:
+        cell = (0, 0, 0)
+        if cell_size > 0:
+            center = obj.matrix_world @ (sum((Vector(corner) for corner in obj.bound_box), Vector()) / 8)
+            cell = tuple(math.floor(value / cell_size) for value in center)
+        groups.setdefault((material_set(obj), cell), []).append(obj)
+    return groups
+
+
+def _read_mesh(obj, depsgraph, materials):
+    """World-space arrays of the evaluated mesh of obj for merging."""
+    import numpy as np
+    mesh = obj.evaluated_get(depsgraph).data
+    n_verts, n_loops, n_faces = len(mesh.vertices), len(mesh.loops), len(mesh.polygons)
+
+    co = np.empty(n_verts * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    loop_verts = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    normals = np.empty(n_loops * 3, dtype=np.float32)
+    mesh.corner_normals.foreach_get("vector", normals)
+    loop_starts = np.empty(n_faces, dtype=np.int32)
+    loop_totals = np.empty(n_faces, dtype=np.int32)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    material_index = np.empty(n_faces, dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", material_index)
+    smooth = np.empty(n_faces, dtype=bool)
+    mesh.polygons.foreach_get("use_smooth", smooth)
+    uvs = {}
+    for uv_layer in mesh.uv_layers:
+        uv = np.empty(n_loops * 2, dtype=np.float32)
+        uv_layer.data.foreach_get("uv", uv)
+        uvs[uv_layer.name] = uv.reshape(-1, 2)
+
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    linear = matrix[:3, :3]
+    co = co.reshape(-1, 3) @ linear.T + matrix[:3, 3]
+    normals = normals.reshape(-1, 3) @ np.linalg.inv(linear)
+    normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+
+    # Mirrored transforms flip the winding; reverse each face's loops to keep normals outward.
+    if np.linalg.det(linear) < 0:
+        starts = np.repeat(loop_starts, loop_totals)
+        source = 2 * starts + np.repeat(loop_totals, loop_totals) - 1 - np.arange(n_loops)
+        loop_verts = loop_verts[source]
+        normals = normals[source]
+        uvs = {name: uv[source] for name, uv in uvs.items()}
+
+    slot_map = np.array([materials.index(slot.material.name) if slot.material else 0
+                         for slot in obj.material_slots] or [0], dtype=np.int32)
+    material_index = slot_map[np.clip(material_index, 0, len(slot_map) - 1)]
+    return co, loop_verts, normals, loop_totals, material_index, smooth, uvs
+
+
+def merge_meshes(objects, depsgraph, materials, name):
+    """Build one world-space mesh from the evaluated meshes of objects by array concatenation.
+
+    Faces keep their material (matched by name), smoothing and normals; UV
+    layers are matched by name and filled with zeros where an object lacks one.
+    """
+    import numpy as np
+    parts = [_read_mesh(obj, depsgraph, materials) for obj in objects]
+    uv_names = list(dict.fromkeys(uv_name for part in parts for uv_name in part[6]))
+
+    vert_offsets = np.cumsum([0] + [len(part[0]) for part in parts])
+    co = np.concatenate([part[0] for part in parts])
+    loop_verts = np.concatenate([part[1] + offset for part, offset in zip(parts, vert_offsets)])
+    normals = np.concatenate([part[2] for part in parts])
+    loop_totals = np.concatenate([part[3] for part in parts])
+    material_index = np.concatenate([part[4] for part in parts])
+    smooth = np.concatenate([part[5] for part in parts])
+    loop_starts = np.concatenate(([0], np.cumsum(loop_totals)[:-1])).astype(np.int32)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+    mesh.loops.add(len(loop_verts))
+    mesh.loops.foreach_set("vertex_index", loop_verts.astype(np.int32))
+    mesh.polygons.add(len(loop_totals))
+    mesh.polygons.foreach_set("loop_start", loop_starts)
+    mesh.polygons.foreach_set("material_index", material_index)
+    mesh.polygons.foreach_set("use_smooth", smooth)
+    mesh.update(calc_edges=True)
+
+    for uv_name in uv_names:
+        uv = np.concatenate([
+            part[6][uv_name] if uv_name in part[6] else np.zeros((len(part[1]), 2), dtype=np.float32)
+            for part in parts
+        ])
+        mesh.uv_layers.new(name=uv_name).data.foreach_set("uv", uv.ravel())
+    for material_name in materials:
+        mesh.materials.append(bpy.data.materials[material_name])
+    mesh.normals_split_custom_set(normals.astype(np.float32))
+    return mesh
+
+
+def static_batch_export(context, objects, path, export_mode, cell_size, cache_size=0):
+    """Merge objects into one mesh per material set and grid cell and export each as one FBX.
+
+    Draw calls are estimated as one per material per object before merging and
+    one per material per group after. The report is also written next to the files.
+    """
+    import json
+    depsgraph = context.evaluated_depsgraph_get()
+    groups = static_batch_groups(objects, cell_size)
+
+    collection = bpy.data.collections.new(STATIC_BATCH_COLLECTION_NAME)
+    context.scene.collection.children.link(collection)
+    report = {
+        "export_mode": export_mode,
+        "cell_size": cell_size,
+        "objects": len(objects),
+        "draw_calls_before": sum(max(1, len(material_set(obj))) for obj in objects),
+        "draw_calls_after": 0,
+        "groups": [],
+    }
+    used = set()
+    try:
+        for (materials, cell), members in sorted(groups.items()):
+            base = bpy.path.clean_name(f"Static_{materials[0] if materials else 'NoMaterial'}_{cell[0]}_{cell[1]}_{cell[2]}")
+            stem = base
+            n = 1
+            while stem in used:
+                n += 1
+                stem = f"{base}_{n}"
+            used.add(stem)
+
+            with Instrumentation.phase(f"merge:{stem}"):
+                mesh = merge_meshes(members, depsgraph, materials, stem)
+            obj = bpy.data.objects.new(stem, mesh)
+            collection.objects.link(obj)
+            with Instrumentation.phase(f"export:{stem}"):
+                export_object(obj, os.path.join(path, f"{stem}.fbx"), export_mode, cache_size=cache_size)
+
+            draw_calls = max(1, len(materials))
+            report["draw_calls_after"] += draw_calls
+            report["groups"].append({
+                "file": f"{stem}.fbx",
+                "objects": [member.name for member in members],
+                "materials": list(materials),
+                "cell": list(cell),
+                "tris": len(mesh.loops) - 2 * len(mesh.polygons),
+                "draw_calls": draw_calls,
+                "acmr": entry_cache_reports([obj]),
+            })
+            Instrumentation.count("objects", len(members))
+    finally:
+        remove_export_collection()
+        remove_temp_objects(collection)
+
+    with open(os.path.join(path, STATIC_BATCH_REPORT_NAME), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=1)
+    return report
+
+
+# ----------------------------
+# Instance Deduplication
+# ----------------------------
+INSTANCES_NAME = "batchfbx_instances.json"
+
+# Modifier settings that do not change the exported geometry.
+_SIGNATURE_SKIP = {"rna_type", "name", "show_expanded", "show_in_editmode", "show_on_cage",
+                   "show_render", "is_active", "is_override_data", "use_pin_to_last"}
+
+
+def modifier_signature(obj):
+    """Describe the viewport modifier stack of obj, settings included."""
+    parts = []
+    for mod in obj.modifiers:
+        if not mod.show_viewport:
+            continue
+        values = [mod.type]
+        for prop in mod.bl_rna.properties:
+            # Read-only properties are runtime state such as execution_time.
+            if prop.identifier in _SIGNATURE_SKIP or prop.is_readonly or prop.type == 'COLLECTION':
+                continue
+            value = getattr(mod, prop.identifier)
+            if prop.type == 'POINTER':
+                value = getattr(value, "name", None)
+            elif getattr(prop, "is_array", False):
+                value = tuple(value)
+            values.append(f"{prop.identifier}={value!r}")
+        # Geometry Nodes inputs are ID properties on the modifier.
+        if mod.type == 'NODES':
+            for key, value in sorted(mod.items()):
+                if hasattr(value, "to_list"):
+                    value = value.to_list()
+                values.append(f"[{key}]={getattr(value, 'name', value)!r}")
+        parts.append(";".join(values))
+    return "|".join(parts)
+
+
+def instance_groups(objects):
+    """Group objects that export to the same geometry.
+
+    Objects match when they share a mesh datablock, material slots and modifier
+    stack. Returns (file stem, objects) pairs, named after the mesh.
+    """
+    groups = {}
+    for obj in objects:
+        materials = tuple(slot.material.name if slot.material else "" for slot in obj.material_slots)
+        key = (obj.data.name, materials, modifier_signature(obj))
+        groups.setdefault(key, []).append(obj)
+
+    result = []
+    used = set()
+    for key in sorted(groups):
+        stem = mesh_name = key[0]
+        n = 1
+        while stem in used:
+            n += 1
+            stem = f"{mesh_name}_{n}"
+        used.add(stem)
+        result.append((stem, sorted(groups[key], key=lambda obj: obj.name)))
+    return result
+
+
+def export_entries(objects, deduplicate):
+    """(file stem, object) pairs to export, and the instance groups when deduplicating."""
+    if not deduplicate:
+        return [(obj.name, obj) for obj in objects], None
+    groups = instance_groups(objects)
+    return [(stem, members[0]) for stem, members in groups], groups
+
+
+def instance_placements(groups):
+    """Transforms of every instance, per exported file, in Blender world space."""
+    placements = {}
+    for stem, members in groups:
+        instances = []
+        for obj in members:
+            location, rotation, scale = obj.matrix_world.decompose()
+            instances.append({
+                "object": obj.name,
+                "location": list(location),
+                "rotation_quaternion": list(rotation),
+                "scale": list(scale),
+                "matrix_world": [list(row) for row in obj.matrix_world],
+            })
+        placements[f"{stem}.fbx"] = instances
+    return placements
+
+
+def save_instances(path, placements, export_mode):
+    """Merge placements into the instance manifest in path."""
+    import json
+    manifest_path = os.path.join(path, INSTANCES_NAME)
+    try:
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            files = json.load(f).get("files", {})
+    except (OSError, ValueError):
+        files = {}
+    files.update(placements)
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "export_mode": export_mode, "files": files}, f, indent=1, sort_keys=True)
+
+
+MANIFEST_NAME = ".batchfbx_manifest.json"
+
+
+def _hash_foreach(h, collection, attr, dtype, width=1):
+    import numpy as np
+    buffer = np.empty(len(collection) * width, dtype=dtype)
+    collection.foreach_get(attr, buffer)
+    h.update(buffer.tobytes())
+
+
+def export_hash(obj, depsgraph, export_mode, at_origin=False, lods=None, cache_size=0):
+    """Hash the evaluated mesh, transform, materials, modifiers, preset and LOD settings of an object.
+
+    With at_origin the transform is left out, as it is not part of the file.
+    """
+    import hashlib
+    import numpy as np
+    h = hashlib.blake2b(digest_size=16)
+    h.update(export_mode.encode())
+    h.update(repr((lods, cache_size)).encode())
+    if at_origin:
+        h.update(b"origin")
+    else:
+        h.update(np.array(obj.matrix_world, dtype=np.float32).tobytes())
+    for slot in obj.material_slots:
+        h.update(f"mat:{slot.material.name if slot.material else ''}\0".encode())
+    for mod in obj.modifiers:
+        h.update(f"mod:{mod.type}:{mod.name}:{mod.show_viewport}\0".encode())
+
+    mesh = obj.evaluated_get(depsgraph).data
+    _hash_foreach(h, mesh.vertices, "co", np.float32, 3)
+    _hash_foreach(h, mesh.edges, "vertices", np.int32, 2)
+    _hash_foreach(h, mesh.loops, "vertex_index", np.int32)
+    _hash_foreach(h, mesh.polygons, "loop_total", np.int32)
+    _hash_foreach(h, mesh.polygons, "material_index", np.int32)
+    _hash_foreach(h, mesh.polygons, "use_smooth", np.bool_)
+    _hash_foreach(h, mesh.corner_normals, "vector", np.float32, 3)
+    for uv_layer in mesh.uv_layers:
+        h.update(f"uv:{uv_layer.name}\0".encode())
+        _hash_foreach(h, uv_layer.data, "uv", np.float32, 2)
+    return h.hexdigest()
+
+
+def load_manifest(path):
+    import json
+    try:
+        with open(os.path.join(path, MANIFEST_NAME), "r", encoding="utf-8") as f:
+            return json.load(f).get("objects", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(path, manifest):
+    import json
+    with open(os.path.join(path, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "objects": manifest}, f, indent=1, sort_keys=True)
+
+
+def filter_unchanged(context, entries, path, export_mode, at_origin=False, lods=None, cache_size=0):
+    """Split (file stem, object) entries into (stale, up_to_date) using the manifest in path.
+
+    Returns (stale, up_to_date, hashes, manifest); hashes is keyed by file stem
+    and covers every entry.
+    """
+    depsgraph = context.evaluated_depsgraph_get()
+    manifest = load_manifest(path)
+    hashes = {}
+    stale = []
+    up_to_date = []
+    for stem, obj in entries:
+        hashes[stem] = export_hash(obj, depsgraph, export_mode, at_origin, lods, cache_size)
+        exported = all(os.path.isfile(os.path.join(path, name)) for name in output_files(stem, lods))
+        if exported and manifest.get(stem) == hashes[stem]:
+            up_to_date.append((stem, obj))
+        else:
+            stale.append((stem, obj))
+    return stale, up_to_date, hashes, manifest
+
+
+def run_export_worker(job_path):
+    """Worker entry point: export the job's entries and report each file stem back."""
+    from . import Workers
+
+    job = Workers.load_job(job_path)
+    lods = job["lods"]
+    found = [(stem, bpy.data.objects[name]) for stem, name in job["entries"] if name in bpy.data.objects]
+    lod_copies = build_lods(bpy.context, found, lods)[1] if lods else {}
+
+    for stem, name in job["entries"]:
+        start = time.perf_counter()
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            Workers.emit(object=stem, ok=False, error="Object not found in snapshot")
+            continue
+        objects = lod_copies.get(name, [obj])
+        try:
+            export_entry(stem, objects, job["output"], job["export_mode"], job["at_origin"], lods, job["cache_size"])
+        except Exception as e:
+            Workers.emit(object=stem, ok=False, error=str(e))
+        else:
+            Workers.emit(object=stem, ok=True, seconds=time.perf_counter() - start,
+                         acmr=entry_cache_reports(objects))
+
+
+# ----------------------------
+# Command Line
+# ----------------------------
+def parse_cli_args(argv=None):
+    import argparse
+    import sys
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="BatchFBX", description="Export mesh objects to individual FBX files")
+    parser.add_argument("--output", required=True, help="export directory (// paths are relative to the .blend)")
+    parser.add_argument("--collection", action="append", default=[],
+                        help="export meshes in this collection, including child collections (repeatable)")
+    parser.add_argument("--name", action="append", default=[],
+                        help="export meshes whose name matches this glob pattern (repeatable)")
+    parser.add_argument("--preset", choices=('VRCHAT', 'DEFAULT'), default='VRCHAT')
+    parser.add_argument("--incremental", action="store_true", help="skip objects unchanged since the last export")
+    parser.add_argument("--deduplicate", action="store_true",
+                        help="export one file per unique mesh and write an instance placement manifest")
+    parser.add_argument("--lods", type=int, default=0, help="generate this many decimated LOD levels per object")
+    parser.add_argument("--lod-ratio", type=float, default=0.5,
+                        help="faces kept by each LOD level relative to the previous one")
+    parser.add_argument("--lod-combined", action="store_true",
+                        help="write all LOD levels into one file instead of {name}_LODn.fbx files")
+    parser.add_argument("--cache-size", type=int, default=0,
+                        help="triangulate and reorder meshes for a GPU vertex cache of this size (0 = off)")
+    parser.add_argument("--static-batch", action="store_true",
+                        help="merge meshes by material set and grid cell and export one file per group")
+    parser.add_argument("--cell-size", type=float, default=20.0,
+                        help="grid cell size in meters for --static-batch (0 = no spatial split)")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="export in this many background Blender processes (0 = in this process)")
+    parser.add_argument("--report", help="also write the JSON result to this file")
+    return parser.parse_args(argv)
+
+
+def cli_objects(scene, collections, patterns):
+    """Mesh objects of scene in any of the named collections or matching any pattern.
+
+    Without filters every mesh in the scene is returned.
+    """
+    import fnmatch
+    objects = [obj for obj in scene.objects if obj.type == 'MESH']
+    if not collections and not patterns:
+        return objects
+
+    in_collections = set()
+    for name in collections:
+        collection = bpy.data.collections.get(name)
+        if collection is None:
+            raise ValueError(f"Collection not found: {name}")
+        in_collections.update(collection.all_objects)
+    return [
+        obj for obj in objects
+        if obj in in_collections or any(fnmatch.fnmatchcase(obj.name, p) for p in patterns)
+    ]
+
+
+def _export_in_process(entries, output, export_mode, at_origin, lods, cache_size):
+    lod_collection = None
+    lod_copies = {}
+    if lods:
+        lod_collection, lod_copies = build_lods(
+            bpy.context, [(stem, bpy.data.objects[name]) for stem, name in entries], lods)
+    try:
+        for stem, name in entries:
+            start = time.perf_counter()
+            objects = lod_copies.get(name, [bpy.data.objects[name]])
+            try:
+                export_entry(stem, objects, output, export_mode, at_origin, lods, cache_size)
+            except Exception as e:
+                yield {"object": stem, "ok": False, "error": str(e)}
+            else:
+                yield {"object": stem, "ok": True, "seconds": time.perf_counter() - start,
+                       "acmr": entry_cache_reports(objects)}
+    finally:
+        remove_temp_objects(lod_collection)
+
+
+def _export_with_workers(entries, output, export_mode, at_origin, lods, cache_size, count):
+    from . import Workers
+    jobs = [
+        {"entries": chunk, "output": output, "export_mode": export_mode, "at_origin": at_origin,
+         "lods": lods, "cache_size": cache_size}
+        for chunk in Workers.split_evenly(entries, count)
+    ]
+    pool = Workers.WorkerPool("BatchFBX", "run_export_worker", jobs)
+    try:
+        pool.start()
+        while True:
+            running = pool.running()
+            yield from pool.poll()
+            if not running:
+                break
+            time.sleep(0.1)
+    finally:
+        pool.terminate()
+        pool.cleanup()
+
+
+def main(argv=None):
+    """Headless entry point, see README. Prints the result as one JSON line.
+
+    Arguments are read after "--" on the Blender command line. Exits with
+    code 1 when any object failed to export.
+    """
+    import json
+    import sys
+    from . import Workers
+
+    args = parse_cli_args(argv)
+    context = bpy.context
+    output = os.path.abspath(bpy.path.abspath(args.output))
+    os.makedirs(output, exist_ok=True)
+
+    if args.static_batch:
+        objects = cli_objects(context.scene, args.collection, args.name)
+        result = {
+            "blend": bpy.data.filepath,
+            "output": output,
+            "preset": args.preset,
+            "static_batch": static_batch_export(context, objects, output, args.preset, args.cell_size,
+                                                args.cache_size),
+        }
+        if args.report:
+            with open(args.report, "w", encoding="utf-8") as f:
+                json.dump(result, f, indent=2)
+        Workers.emit(**result)
+        return result
+
+    lods = {"levels": args.lods, "ratio": args.lod_ratio, "combined": args.lod_combined} if args.lods > 0 else None
+    entries, groups = export_entries(cli_objects(context.scene, args.collection, args.name), args.deduplicate)
+    manifest = None
+    skipped = []
+    if args.incremental:
+        entries, up_to_date, hashes, manifest = filter_unchanged(
+            context, entries, output, args.preset, args.deduplicate, lods, args.cache_size)
+        skipped = [stem for stem, obj in up_to_date]
+
+    entries = [(stem, obj.name) for stem, obj in entries]
+    if args.workers > 0 and entries:
+        messages = _export_with_workers(entries, output, args.preset, args.deduplicate, lods,
+                                        args.cache_size, args.workers)
+    else:
+        messages = _export_in_process(entries, output, args.preset, args.deduplicate, lods, args.cache_size)
+
+    result = {
+        "blend": bpy.data.filepath,
+        "output": output,
+        "preset": args.preset,
+        "exported": [],
+        "skipped": skipped,
+        "failed": [],
+    }
+    start = time.perf_counter()
+    try:
+        for message in messages:
+            name = message["object"]
+            if message.get("ok"):
+                result["exported"].append({
+                    "object": name,
+                    "files": [os.path.join(output, file) for file in output_files(name, lods)],
+                    "seconds": round(message.get("seconds", 0.0), 4),
+                })
+                if message.get("acmr"):
+                    result["exported"][-1]["acmr"] = message["acmr"]
+                if manifest is not None:
+                    manifest[name] = hashes[name]
+            else:
+                result["failed"].append({"object": name, "error": message.get("error", "")})
+        reported = {entry["object"] for entry in result["exported"] + result["failed"]}
+        for stem, name in entries:
+            if stem not in reported:
+                result["failed"].append({"object": stem, "error": "Worker exited without reporting"})
+    finally:
+        remove_export_collection()
+        if manifest is not None:
+            save_manifest(output, manifest)
+        if groups is not None:
+            save_instances(output, instance_placements(groups), args.preset)
+            result["instances"] = os.path.join(output, INSTANCES_NAME)
+    result["seconds"] = round(time.perf_counter() - start, 4)
+
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+    Workers.emit(**result)
+
+    if result["failed"]:
+        sys.exit(1)
+    return result
 
 
 # ----------------------------
@@ -53,6 +1035,89 @@ class BatchFBXProperties(PropertyGroup):
 
     recent_names: CollectionProperty(type=bpy.types.PropertyGroup)
 
+    use_parallel: BoolProperty(
+        name="Parallel Export",
+        description="Export in background Blender processes so the UI stays responsive",
+        default=False
+    )
+
+    incremental: BoolProperty(
+        name="Skip Unchanged",
+        description="Only export objects whose mesh, transform, materials, modifiers or preset changed since the last export",
+        default=False
+    )
+
+    deduplicate: BoolProperty(
+        name="Share Instances",
+        description="Export one FBX per unique mesh (with the same materials and modifiers) at the origin, "
+                    "and write the instance transforms to a placement manifest",
+        default=False
+    )
+
+    static_batch: BoolProperty(
+        name="Static Batch",
+        description="Merge selected meshes by material set and grid cell and export one FBX per group",
+        default=False
+    )
+
+    batch_cell_size: FloatProperty(
+        name="Cell Size",
+        description="Size of the grid cells meshes are grouped by (0 = no spatial split)",
+        default=20.0,
+        min=0.0,
+        unit='LENGTH'
+    )
+
+    generate_lods: BoolProperty(
+        name="Generate LODs",
+        description="Export decimated LOD levels of every object",
+        default=False
+    )
+
+    lod_levels: IntProperty(
+        name="LOD Levels",
+        description="Number of LOD levels after LOD0",
+        default=2,
+        min=1,
+        max=6
+    )
+
+    lod_ratio: FloatProperty(
+        name="LOD Ratio",
+        description="Share of triangles each LOD level keeps from the previous one",
+        default=0.5,
+        min=0.01,
+        max=1.0,
+        subtype='FACTOR'
+    )
+
+    lod_combined: BoolProperty(
+        name="One File per Object",
+        description="Write all LOD levels into one FBX with Unity's _LODn naming instead of one file per level",
+        default=False
+    )
+
+    optimize_cache: BoolProperty(
+        name="Optimize Vertex Cache",
+        description="Triangulate and reorder triangles and vertices for the GPU vertex cache before export",
+        default=False
+    )
+
+    cache_size: IntProperty(
+        name="Cache Size",
+        description="Vertex cache size to optimize for",
+        default=16,
+        min=4,
+        max=64
+    )
+
+    worker_count: IntProperty(
+        name="Workers",
+        description="Number of background Blender processes (0 = one per CPU core)",
+        default=0,
+        min=0
+    )
+
 
 # ----------------------------
 # Operators
@@ -87,58 +1152,343 @@ class BATCHFBX_OT_ToggleMode(Operator):
 class BATCHFBX_OT_Export(Operator):
     bl_idname = "batchfbx.export"
     bl_label = "Export FBX"
-    bl_description = "Export selected meshes to individual FBX files"
+    bl_description = "Export selected meshes to individual FBX files (Esc to cancel)"
+
+    # Seconds of export work per timer tick before control goes back to the UI.
+    tick_budget = 0.1
+
+    _timer = None
+
+    def prepare(self, context):
+        props = context.scene.batchfbx_props
+        path = bpy.path.abspath(props.export_path)
+        selected = [obj for obj in context.selected_objects if obj.type == 'MESH']
+
+        if not path or not selected:
+            self.report({'ERROR'}, "Set a path and select at least one mesh")
+            return False
+
+        props.recent_names.clear()
+        props.show_recent = False
+        props.progress = 0.0
+
+        self._path = path
+        self._export_mode = props.export_mode
+        self._at_origin = props.deduplicate
+        self._lods = lod_settings(props)
+        self._cache_size = cache_setting(props)
+        cache_reports.clear()
+        entries, groups = export_entries(selected, props.deduplicate)
+        self._placements = instance_placements(groups) if groups is not None else None
+        self._manifest = None
+        self._up_to_date = 0
+        if props.incremental:
+            with Instrumentation.phase("hash"):
+                entries, up_to_date, self._hashes, self._manifest = filter_unchanged(
+                    context, entries, path, props.export_mode, self._at_origin, self._lods, self._cache_size)
+            self._up_to_date = len(up_to_date)
+
+        self._lod_collection = None
+        self._lod_copies = {}
+        if self._lods and entries:
+            with Instrumentation.phase("lods"):
+                self._lod_collection, self._lod_copies = build_lods(context, entries, self._lods)
+
+        self._entries = [(stem, obj.name) for stem, obj in entries]
+        self._done = 0
+        self._failed = []
+        self._average = 0.0
+        return True
+
+    def export_next(self, context):
+        """Export the next queued object and return how long it took."""
+        props = context.scene.batchfbx_props
+        stem, name = self._entries[self._done]
+        obj = context.scene.objects.get(name)
+        start = time.perf_counter()
+
+        if obj is None:
+            self._failed.append(stem)
+            print(f"BatchFBX: failed to export {stem}: object not found")
+        else:
+            try:
+                with Instrumentation.phase(f"export:{stem}"):
+                    export_entry(stem, self._lod_copies.get(name, [obj]), self._path,
+                                 self._export_mode, self._at_origin, self._lods, self._cache_size)
+            except Exception as e:
+                self._failed.append(stem)
+                print(f"BatchFBX: failed to export {stem}: {e}")
+            else:
+                Instrumentation.count("objects", 1)
+                item = props.recent_names.add()
+                item.name = stem
+                if self._manifest is not None:
+                    self._manifest[stem] = self._hashes[stem]
+
+        self._done += 1
+        props.progress = self._done / len(self._entries)
+        return time.perf_counter() - start
+
+    def report_done(self, cancelled=False):
+        remove_export_collection()
+        remove_temp_objects(self._lod_collection)
+        self._lod_collection = None
+        if self._manifest is not None:
+            save_manifest(self._path, self._manifest)
+        if self._placements is not None:
+            save_instances(self._path, self._placements, self._export_mode)
+
+        acmr = ""
+        if cache_reports:
+            lines = format_cache_reports(cache_reports)
+            print("BatchFBX vertex cache:\n  " + "\n  ".join(lines))
+            acmr = f", {lines[-1]}"
+
+        total = len(self._entries)
+        exported = self._done - len(self._failed)
+        if cancelled:
+            self.report({'WARNING'}, f"Export cancelled after {self._done} of {total} object(s)")
+        elif self._failed or self._done < total:
+            self.report({'WARNING'}, f"Exported {exported} of {total} object(s), see console for failures")
+        elif self._manifest is not None:
+            self.report({'INFO'}, f"{total} exported, {self._up_to_date} up to date{acmr}")
+        else:
+            self.report({'INFO'}, f"Exported {total} object(s){acmr}")
 
     def execute(self, context):
+        if not self.prepare(context):
+            return {'CANCELLED'}
+
+        try:
+            while self._done < len(self._entries):
+                self.export_next(context)
+        finally:
+            self.report_done()
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        if not self.prepare(context):
+            return {'CANCELLED'}
+        if not self._entries:
+            self.report_done()
+            return {'FINISHED'}
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.01, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            context.window_manager.event_timer_remove(self._timer)
+            self.report_done(cancelled=True)
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        # Stays True if an export raises, so the finally block still cleans up.
+        finished = True
+        try:
+            # Always export one object, then keep going while the next one is
+            # expected to fit in the tick budget (moving average of recent exports).
+            tick_start = time.perf_counter()
+            while self._done < len(self._entries):
+                seconds = self.export_next(context)
+                self._average = seconds if self._done == 1 else 0.7 * self._average + 0.3 * seconds
+                if time.perf_counter() - tick_start + self._average > self.tick_budget:
+                    break
+
+            for area in context.screen.areas:
+                if area.type == 'VIEW_3D':
+                    area.tag_redraw()
+            finished = self._done >= len(self._entries)
+        finally:
+            if finished:
+                context.window_manager.event_timer_remove(self._timer)
+                self.report_done()
+        return {'FINISHED'} if finished else {'PASS_THROUGH'}
+
+
+class BATCHFBX_OT_ExportParallel(Operator):
+    bl_idname = "batchfbx.export_parallel"
+    bl_label = "Export FBX (Parallel)"
+    bl_description = "Export selected meshes to individual FBX files using background Blender processes"
+
+    _timer = None
+    _pool = None
+
+    def start(self, context):
+        """Start the worker pool; returns the operator result instead when there is nothing to run."""
+        from . import Workers
+
         props = context.scene.batchfbx_props
-        path = props.export_path
+        path = bpy.path.abspath(props.export_path)
         selected = [obj for obj in context.selected_objects if obj.type == 'MESH']
 
         if not path or not selected:
             self.report({'ERROR'}, "Set a path and select at least one mesh")
             return {'CANCELLED'}
+        # The path may be edited while workers run; the manifest belongs next to the files.
+        self._path = path
+
+        entries, groups = export_entries(selected, props.deduplicate)
+        if groups is not None:
+            save_instances(path, instance_placements(groups), props.export_mode)
+
+        self._manifest = None
+        self._up_to_date = 0
+        if props.incremental:
+            with Instrumentation.phase("hash"):
+                entries, up_to_date, self._hashes, self._manifest = filter_unchanged(
+                    context, entries, path, props.export_mode, props.deduplicate, lod_settings(props),
+                    cache_setting(props))
+            self._up_to_date = len(up_to_date)
+            if not entries:
+                props.progress = 1.0
+                self.report({'INFO'}, f"0 exported, {self._up_to_date} up to date")
+                return {'FINISHED'}
+
+        entries = [(stem, obj.name) for stem, obj in entries]
+        count = props.worker_count or Workers.default_worker_count()
+        jobs = [
+            {"entries": chunk, "output": path, "export_mode": props.export_mode,
+             "at_origin": props.deduplicate, "lods": lod_settings(props), "cache_size": cache_setting(props)}
+            for chunk in Workers.split_evenly(entries, count)
+        ]
+
+        self._pool = Workers.WorkerPool("BatchFBX", "run_export_worker", jobs)
+        try:
+            with Instrumentation.phase("start_workers"):
+                self._pool.start()
+        except (OSError, RuntimeError) as e:
+            self._pool.terminate()
+            self._pool.cleanup()
+            self.report({'ERROR'}, f"Could not start export workers: {e}")
+            return {'CANCELLED'}
 
         props.recent_names.clear()
         props.show_recent = False
+        props.progress = 0.0
+        cache_reports.clear()
+        self._total = len(entries)
+        self._done = 0
+        self._failed = []
+        self._jobs = len(jobs)
+        return None
 
-        context.window.cursor_set("WAIT")
-        bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
-
-        total = len(selected)
-        for i, obj in enumerate(selected):
-            bpy.ops.object.select_all(action='DESELECT')
-            obj.select_set(True)
-            context.view_layer.objects.active = obj
-
-            export_file = os.path.join(path, f"{obj.name}.fbx")
-
-            if props.export_mode == 'VRCHAT':
-                bpy.ops.export_scene.fbx(
-                    filepath=export_file,
-                    use_selection=True,
-                    object_types={'MESH'},
-                    apply_scale_options='FBX_SCALE_UNITS',
-                    add_leaf_bones=False,
-                    bake_anim_use_all_bones=False,
-                    bake_anim_use_nla_strips=False,
-                    bake_anim_use_all_actions=False,
-                    use_custom_props=False,
-                    mesh_smooth_type='OFF'
-                )
+    def merge(self, context, messages):
+        props = context.scene.batchfbx_props
+        for message in messages:
+            self._done += 1
+            if message.get("ok"):
+                Instrumentation.add_phase(f"export:{message['object']}", message.get("seconds", 0.0))
+                Instrumentation.count("objects", 1)
+                item = props.recent_names.add()
+                item.name = message["object"]
+                if self._manifest is not None:
+                    self._manifest[message["object"]] = self._hashes[message["object"]]
+                for name, (before, after) in message.get("acmr", {}).items():
+                    cache_reports[name] = (before, after)
             else:
-                bpy.ops.export_scene.fbx(
-                    filepath=export_file,
-                    use_selection=True
-                )
+                self._failed.append(message["object"])
+                print(f"BatchFBX: failed to export {message['object']}: {message.get('error')}")
 
-            item = props.recent_names.add()
-            item.name = obj.name
+        props.progress = self._done / self._total
+
+    def finish(self, context, cancelled=False):
+        if self._timer is not None:
+            context.window_manager.event_timer_remove(self._timer)
+        self._pool.cleanup()
+        if cache_reports:
+            print("BatchFBX vertex cache:\n  " + "\n  ".join(format_cache_reports(cache_reports)))
+        if self._manifest is not None:
+            save_manifest(self._path, self._manifest)
+
+        exported = self._done - len(self._failed)
+        if cancelled:
+            self.report({'WARNING'}, f"Export cancelled after {self._done} of {self._total} object(s)")
+        elif self._failed or self._done < self._total:
+            self.report({'WARNING'}, f"Exported {exported} of {self._total} object(s), see console for failures")
+        elif self._manifest is not None:
+            self.report({'INFO'}, f"{exported} exported, {self._up_to_date} up to date")
+        else:
+            self.report({'INFO'}, f"Exported {exported} object(s)")
+
+    def execute(self, context):
+        result = self.start(context)
+        if result is not None:
+            return result
+
+        while True:
+            running = self._pool.running()
+            self.merge(context, self._pool.poll())
+            if not running:
+                break
+            time.sleep(0.1)
 
-            props.progress = (i + 1) / total
-            bpy.ops.wm.redraw_timer(type='DRAW_WIN_SWAP', iterations=1)
+        self.finish(context)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        result = self.start(context)
+        if result is not None:
+            return result
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.2, window=context.window)
+        wm.modal_handler_add(self)
+        self.report({'INFO'}, f"Exporting {self._total} object(s) with {self._jobs} worker(s)")
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._pool.terminate()
+            self.finish(context, cancelled=True)
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        running = self._pool.running()
+        self.merge(context, self._pool.poll())
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
 
-        context.window.cursor_set("DEFAULT")
-        self.report({'INFO'}, f"Exported {total} object(s)")
+        if running:
+            return {'PASS_THROUGH'}
+
+        self.finish(context)
+        return {'FINISHED'}
+
+
+class BATCHFBX_OT_ExportStaticBatch(Operator):
+    bl_idname = "batchfbx.export_static_batch"
+    bl_label = "Export Static Batches"
+    bl_description = "Merge selected meshes by material set and grid cell and export one FBX per group"
+
+    def execute(self, context):
+        props = context.scene.batchfbx_props
+        path = bpy.path.abspath(props.export_path)
+        selected = [obj for obj in context.selected_objects if obj.type == 'MESH']
+
+        if not path or not selected:
+            self.report({'ERROR'}, "Set a path and select at least one mesh")
+            return {'CANCELLED'}
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        report = static_batch_export(context, selected, path, props.export_mode, props.batch_cell_size,
+                                     cache_setting(props))
+
+        props.recent_names.clear()
+        for group in report["groups"]:
+            item = props.recent_names.add()
+            item.name = group["file"]
+        props.progress = 1.0
+        self.report({'INFO'}, f"{len(report['groups'])} batch(es) from {len(selected)} object(s), "
+                              f"~{report['draw_calls_before']} -> ~{report['draw_calls_after']} draw calls")
         return {'FINISHED'}
 
 
@@ -188,7 +1538,42 @@ class BATCHFBX_PT_MainPanel(Panel):
         # Export Row: Count + Export Button
         row = layout.row(align=True)
         row.label(text=f"Selected: {len(selected)}", icon='MESH_CUBE')
-        row.operator("batchfbx.export", text="Export", icon='EXPORT')
+        if props.static_batch:
+            op_id = "batchfbx.export_static_batch"
+        elif props.use_parallel:
+            op_id = "batchfbx.export_parallel"
+        else:
+            op_id = "batchfbx.export"
+        row.operator(op_id, text="Export", icon='EXPORT')
+
+        row = layout.row(align=True)
+        row.prop(props, "incremental")
+        row.prop(props, "deduplicate")
+
+        row = layout.row(align=True)
+        row.prop(props, "static_batch")
+        sub = row.row(align=True)
+        sub.enabled = props.static_batch
+        sub.prop(props, "batch_cell_size")
+
+        row = layout.row(align=True)
+        row.prop(props, "optimize_cache")
+        sub = row.row(align=True)
+        sub.enabled = props.optimize_cache
+        sub.prop(props, "cache_size")
+
+        layout.prop(props, "generate_lods")
+        if props.generate_lods:
+            row = layout.row(align=True)
+            row.prop(props, "lod_levels")
+            row.prop(props, "lod_ratio")
+            layout.prop(props, "lod_combined")
+
+        row = layout.row(align=True)
+        row.prop(props, "use_parallel")
+        sub = row.row(align=True)
+        sub.enabled = props.use_parallel
+        sub.prop(props, "worker_count")
 
         # Progress
         layout.prop(props, "progress", text="Progress", slider=True)
@@ -211,6 +1596,8 @@ classes = (
     BATCHFBX_OT_SetPath,
     BATCHFBX_OT_ToggleMode,
     BATCHFBX_OT_Export,
+    BATCHFBX_OT_ExportParallel,
+    BATCHFBX_OT_ExportStaticBatch,
     BATCHFBX_PT_MainPanel,
 )
 
@@ -0,0 +1,167 @@
+import bpy
+import collections
+import contextlib
+import functools
+import json
+import os
+import time
+
+RING_SIZE = 50
+PROFILE_LINES = 25
+
+# Most recent operator runs, newest last.
+records = collections.deque(maxlen=RING_SIZE)
+
+# Records of operator calls currently on the stack.
+_active = []
+
+# ------------------------------------------------------------------------
+#   Records
+# ------------------------------------------------------------------------
+
+class OperatorRecord:
+    """Timing data for one operator run; modal operators keep one record until they finish."""
+
+    def __init__(self, operator, owner):
+        self.operator = operator
+        self.owner = owner
+        self.started = time.time()
+        self.seconds = 0.0
+        self.phases = []
+        self.counts = {}
+        self.result = ""
+        self.profile = ""
+
+    def as_dict(self):
+        return {
+            "operator": self.operator,
+            "started": time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(self.started)),
+            "seconds": round(self.seconds, 6),
+            "elapsed": round(time.time() - self.started, 6),
+            "result": self.result,
+            "phases": [(name, round(seconds, 6)) for name, seconds in self.phases],
+            "counts": self.counts,
+            "profile": self.profile,
+        }
+
+def preferences():
+    addon = bpy.context.preferences.addons.get(__package__)
+    return addon.preferences if addon else None
+
+def log_path():
+    directory = bpy.utils.user_resource('CONFIG', path="defaultcube", create=True)
+    return os.path.join(directory, "profile.log")
+
+def write_log(entries):
+    with open(log_path(), "a", encoding="utf-8") as f:
+        for record in entries:
+            f.write(json.dumps(record.as_dict()) + "\n")
+
+def _finish(record, result):
+    record.result = ",".join(sorted(result)) if isinstance(result, set) else str(result)
+    records.append(record)
+    prefs = preferences()
+    if prefs and prefs.log_to_file:
+        try:
+            write_log([record])
+        except OSError as e:
+            print(f"DefaultCube: could not write profile log: {e}")
+    if record.profile:
+        print(f"\n--- Profile: {record.operator} ---\n{record.profile}")
+
+
+# ------------------------------------------------------------------------
+#   Recording API
+# ------------------------------------------------------------------------
+
+@contextlib.contextmanager
+def phase(name):
+    """Time a block as a named phase of the operator currently running."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        add_phase(name, time.perf_counter() - start)
+
+def add_phase(name, seconds):
+    if _active:
+        _active[-1].phases.append((name, seconds))
+
+def count(name, value):
+    """Add value to a named element/object counter of the running operator."""
+    if _active:
+        counts = _active[-1].counts
+        counts[name] = counts.get(name, 0) + value
+
+
+# ------------------------------------------------------------------------
+#   Operator wrapping
+# ------------------------------------------------------------------------
+
+def _call(idname, fn, self, context, *args):
+    # invoke() calling self.execute() is part of the same run.
+    if _active and _active[-1].owner is self:
+        return fn(self, context, *args)
+
+    record = getattr(self, "_instrumentation_record", None) or OperatorRecord(idname, self)
+    prefs = preferences()
+    profiler = None
+    if prefs and prefs.enable_profiling:
+        import cProfile
+        profiler = cProfile.Profile()
+
+    _active.append(record)
+    start = time.perf_counter()
+    try:
+        if profiler:
+            profiler.enable()
+        result = fn(self, context, *args)
+    except Exception:
+        _active.pop()
+        record.seconds += time.perf_counter() - start
+        _finish(record, "ERROR")
+        raise
+    finally:
+        if profiler:
+            profiler.disable()
+
+    record.seconds += time.perf_counter() - start
+    _active.pop()
+    if profiler:
+        import io
+        import pstats
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(PROFILE_LINES)
+        record.profile += stream.getvalue()
+
+    if 'RUNNING_MODAL' in result:
+        self._instrumentation_record = record
+    elif 'PASS_THROUGH' not in result:
+        self._instrumentation_record = None
+        _finish(record, result)
+    return result
+
+def _wrap(idname, fn, method):
+    # Blender validates the positional parameter count of execute/invoke/modal,
+    # so each wrapper has to match the signature of the method it replaces.
+    if method == "execute":
+        @functools.wraps(fn)
+        def wrapper(self, context):
+            return _call(idname, fn, self, context)
+    else:
+        @functools.wraps(fn)
+        def wrapper(self, context, event):
+            return _call(idname, fn, self, context, event)
+
+    wrapper._instrumented = True
+    return wrapper
+
+def instrument(classes):
+    """Record every execute/invoke/modal call of the Operator classes given."""
+    for cls in classes:
+        if not issubclass(cls, bpy.types.Operator):
+            continue
+        for method in ("execute", "invoke", "modal"):
+            fn = cls.__dict__.get(method)
+            if fn is not None and not getattr(fn, "_instrumented", False):
+                setattr(cls, method, _wrap(cls.bl_idname, fn, method))
@@ -0,0 +1,28 @@
+def connected_components(n, a, b):
+    """Label n nodes by connected component of the (a[i], b[i]) edges.
+
+    Each label is the smallest node index of its component. Roots are hooked
+    onto the smaller neighbouring root and then fully pointer-jumped, so the
+    number of rounds grows with log(n) rather than with component diameter.
+    """
+    import numpy as np
+    parent = np.arange(n)
+    a = np.asarray(a, dtype=np.int64)
+    b = np.asarray(b, dtype=np.int64)
+    while True:
+        ra = parent[a]
+        rb = parent[b]
+        linked = ra != rb
+        if not linked.any():
+            return parent
+        ra = ra[linked]
+        rb = rb[linked]
+        a = a[linked]
+        b = b[linked]
+        parent[np.maximum(ra, rb)] = np.minimum(ra, rb)
+        # Pointer jumping: follow every node to its current root.
+        while True:
+            jumped = parent[parent]
+            if np.array_equal(jumped, parent):
+                break
+            parent = jumped
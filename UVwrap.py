@@ -10,56 +10,505 @@ bl_info = {
 
 import bpy
 import bmesh
-import sys
-import io
-from mathutils import Vector
+import time
+from bpy.app.handlers import persistent
+from . import Instrumentation
+from . import MeshGraph
 
 last_object_id_global = None
+_msgbus_owner = object()
+
+# Upper edges of the texel density histogram bins; the last bin is open-ended.
+DENSITY_BIN_EDGES = (0.5, 0.8, 0.95, 1.05, 1.25, 2.0)
+DENSITY_BIN_LABELS = ("< 0.5x", "0.5-0.8x", "0.8-0.95x", "0.95-1.05x", "1.05-1.25x", "1.25-2x", "> 2x")
+
+# Last texel density analysis per scene name, filled by UVWRAP_OT_AnalyzeDensity.
+_density_reports = {}
 
 # --------------------------
 # Helpers
 # --------------------------
 
-def get_best_uv_axes(normal):
-    normal = normal.normalized()
-    up = Vector((0, 0, 1))
-    forward = Vector((0, 1, 0))
-    if abs(normal.dot(up)) > 0.9:
-        return 0, 1
-    elif abs(normal.dot(forward)) > 0.9:
-        return 0, 2
+UNWRAP_METHODS = [
+    ('ANGLE_BASED', 'Angle Based', 'Organic meshes'),
+    ('CONFORMAL', 'Conformal', 'Hard-surface meshes'),
+    ('SMART_PROJECT', 'Smart UV Project', 'Blender’s Smart UV Project'),
+    ('WORLD_PROJECT', 'Box/World Projection', 'Project from world axes only, without running an unwrap solver'),
+]
+
+def read_mesh_topology(mesh):
+    """Return (loop_verts, loop_face, loop_next) index arrays for a mesh.
+
+    loop_next is the next loop around the same face, wrapping at the end.
+    """
+    import numpy as np
+    n_faces = len(mesh.polygons)
+    n_loops = len(mesh.loops)
+
+    loop_starts = np.empty(n_faces, dtype=np.int64)
+    loop_totals = np.empty(n_faces, dtype=np.int64)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_face = np.repeat(np.arange(n_faces), loop_totals)
+
+    loop_next = np.arange(1, n_loops + 1)
+    loop_next[loop_starts + loop_totals - 1] = loop_starts
+
+    loop_verts = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    return loop_verts, loop_face, loop_next
+
+def world_positions(obj):
+    """Vertex positions of obj's mesh in world space as an (N, 3) array."""
+    import numpy as np
+    mesh = obj.data
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    matrix = np.array(obj.matrix_world, dtype=np.float64)
+    return co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+def read_uvs(uv_layer):
+    import numpy as np
+    uvs = np.empty(len(uv_layer.data) * 2, dtype=np.float32)
+    uv_layer.data.foreach_get("uv", uvs)
+    return uvs.reshape(-1, 2)
+
+def face_world_areas(world, loop_verts, loop_face, loop_next, n_faces):
+    """Polygon areas from the Newell sum of edge cross products."""
+    import numpy as np
+    cross = np.cross(world[loop_verts], world[loop_verts[loop_next]])
+    summed = np.column_stack([np.bincount(loop_face, cross[:, i], minlength=n_faces) for i in range(3)])
+    return 0.5 * np.linalg.norm(summed, axis=1)
+
+def face_uv_areas(uvs, loop_face, loop_next, n_faces):
+    """Unsigned polygon areas in UV space (shoelace formula)."""
+    import numpy as np
+    cross = uvs[:, 0] * uvs[loop_next, 1] - uvs[loop_next, 0] * uvs[:, 1]
+    return 0.5 * np.abs(np.bincount(loop_face, cross, minlength=n_faces))
+
+def uv_island_labels(loop_verts, loop_face, loop_next, uvs, n_faces):
+    """Label every face with its UV island index.
+
+    Two faces belong to the same island when they share a mesh edge and the
+    UVs of both edge vertices match on each side, i.e. the edge is not a seam.
+    """
+    import numpy as np
+    a = loop_verts
+    b = loop_verts[loop_next]
+    swap = a > b
+    uv_a = uvs
+    uv_b = uvs[loop_next]
+    edge_uvs = np.where(swap[:, None], np.hstack([uv_b, uv_a]), np.hstack([uv_a, uv_b]))
+    keys = np.column_stack([
+        np.minimum(a, b),
+        np.maximum(a, b),
+        np.round(np.nan_to_num(edge_uvs) * 1e5).astype(np.int64),
+    ])
+    _, key_index = np.unique(keys, axis=0, return_inverse=True)
+    key_index = key_index.ravel()
+
+    # Join every face to one face sharing the same edge key.
+    key_face = np.empty(key_index.max() + 1 if len(key_index) else 0, dtype=np.int64)
+    key_face[key_index] = loop_face
+    labels = MeshGraph.connected_components(n_faces, loop_face, key_face[key_index])
+
+    return np.unique(labels, return_inverse=True)[1].ravel()
+
+def project_world_uvs(obj, scale):
+    """Box-project the active UV layer of obj from world space, 1 UV unit = scale meters.
+
+    Must run in Object Mode so the mesh data is in sync with edit changes.
+    """
+    import numpy as np
+    mesh = obj.data
+    uv_layer = mesh.uv_layers.active or mesh.uv_layers.new()
+
+    n_loops = len(mesh.loops)
+    n_faces = len(mesh.polygons)
+    if not n_loops:
+        return
+
+    world = world_positions(obj)
+
+    normals = np.empty(n_faces * 3, dtype=np.float32)
+    mesh.polygons.foreach_get("normal", normals)
+    normals = normals.reshape(-1, 3)
+    normals /= np.maximum(np.linalg.norm(normals, axis=1), 1e-12)[:, None]
+
+    # Upward faces map to XY, forward-facing walls to XZ, the rest to YZ.
+    facing_up = np.abs(normals[:, 2]) > 0.9
+    facing_forward = ~facing_up & (np.abs(normals[:, 1]) > 0.9)
+    u_axis = np.where(facing_up | facing_forward, 0, 1)
+    v_axis = np.where(facing_up, 1, 2)
+
+    loop_verts, loop_face, _loop_next = read_mesh_topology(mesh)
+
+    points = world[loop_verts]
+    rows = np.arange(n_loops)
+    uvs = np.empty((n_loops, 2), dtype=np.float32)
+    uvs[:, 0] = points[rows, u_axis[loop_face]] / scale
+    uvs[:, 1] = points[rows, v_axis[loop_face]] / scale
+
+    uv_layer.data.foreach_set("uv", uvs.ravel())
+    mesh.update()
+
+def rescale_uv_islands(obj, scale):
+    """Scale each UV island about its centre so 1 UV unit = scale meters.
+
+    The island layout from the solver is kept; only its size changes, using the
+    ratio of world area to UV area. Returns the number of islands.
+    """
+    import numpy as np
+    mesh = obj.data
+    uv_layer = mesh.uv_layers.active
+    n_faces = len(mesh.polygons)
+    if uv_layer is None or not n_faces:
+        return 0
+
+    loop_verts, loop_face, loop_next = read_mesh_topology(mesh)
+    uvs = read_uvs(uv_layer).astype(np.float64)
+    labels = uv_island_labels(loop_verts, loop_face, loop_next, uvs, n_faces)
+    n_islands = int(labels.max()) + 1
+
+    world_area = face_world_areas(world_positions(obj), loop_verts, loop_face, loop_next, n_faces)
+    uv_area = face_uv_areas(uvs, loop_face, loop_next, n_faces)
+    island_world = np.bincount(labels, world_area, minlength=n_islands)
+    island_uv = np.bincount(labels, uv_area, minlength=n_islands)
+
+    degenerate = island_uv <= 1e-12
+    factor = np.sqrt(island_world / np.where(degenerate, 1.0, island_uv)) / scale
+    factor[degenerate] = 1.0
+
+    loop_island = labels[loop_face]
+    counts = np.bincount(loop_island, minlength=n_islands)
+    center = np.column_stack([np.bincount(loop_island, uvs[:, i], minlength=n_islands) for i in range(2)])
+    center /= counts[:, None]
+
+    uvs = (uvs - center[loop_island]) * factor[loop_island, None] + center[loop_island]
+    uv_layer.data.foreach_set("uv", uvs.astype(np.float32).ravel())
+    mesh.update()
+    return n_islands
+
+def face_density_ratios(obj, scale):
+    """Per-face texel density relative to the target, 1.0 = 1 UV unit per scale meters.
+
+    Uses the linear ratio sqrt(uv_area / world_area) * scale. Faces without
+    world-space area, or meshes without UVs, give NaN.
+    """
+    import numpy as np
+    mesh = obj.data
+    uv_layer = mesh.uv_layers.active
+    n_faces = len(mesh.polygons)
+    if uv_layer is None:
+        return np.full(n_faces, np.nan)
+
+    loop_verts, loop_face, loop_next = read_mesh_topology(mesh)
+    uvs = read_uvs(uv_layer).astype(np.float64)
+    world_area = face_world_areas(world_positions(obj), loop_verts, loop_face, loop_next, n_faces)
+    uv_area = face_uv_areas(uvs, loop_face, loop_next, n_faces)
+
+    ratios = np.full(n_faces, np.nan)
+    valid = world_area > 1e-12
+    ratios[valid] = np.sqrt(uv_area[valid] / world_area[valid]) * scale
+    return ratios
+
+def skyline_pack(sizes, width):
+    """Bottom-left skyline packing of (w, h) rectangles into a strip of the given width.
+
+    Every rectangle must be at most width wide. Returns (positions, used height)
+    with one (x, y) per rectangle, in input order.
+    """
+    order = sorted(range(len(sizes)), key=lambda i: (sizes[i][1], sizes[i][0]), reverse=True)
+    skyline = [[0.0, 0.0, width]]  # segments of [x, y, w], sorted by x
+    positions = [None] * len(sizes)
+    height = 0.0
+
+    for i in order:
+        w, h = sizes[i]
+        best = None
+        for start in range(len(skyline)):
+            x = skyline[start][0]
+            if x + w > width + 1e-9:
+                break
+            y = 0.0
+            covered = 0.0
+            j = start
+            while covered < w - 1e-12 and j < len(skyline):
+                y = max(y, skyline[j][1])
+                covered += skyline[j][2]
+                j += 1
+            if best is None or y < best[0]:
+                best = (y, start, x)
+
+        y, start, x = best
+        positions[i] = (x, y)
+        height = max(height, y + h)
+
+        # Raise the skyline under the new rectangle.
+        end = x + w
+        skyline.insert(start, [x, y + h, w])
+        j = start + 1
+        while j < len(skyline):
+            seg = skyline[j]
+            if seg[0] >= end - 1e-12:
+                break
+            seg_end = seg[0] + seg[2]
+            if seg_end <= end + 1e-12:
+                del skyline[j]
+            else:
+                seg[2] = seg_end - end
+                seg[0] = end
+                break
+
+        k = 0
+        while k < len(skyline) - 1:
+            if abs(skyline[k][1] - skyline[k + 1][1]) < 1e-12:
+                skyline[k][2] += skyline[k + 1][2]
+                del skyline[k + 1]
+            else:
+                k += 1
+
+    return positions, height
+
+def pack_square(sizes):
+    """Skyline-pack rectangles into a roughly square area; returns (positions, side)."""
+    import math
+    total = sum(w * h for w, h in sizes)
+    width = max(max(w for w, _h in sizes), math.sqrt(total / 0.85))
+    for _ in range(6):
+        positions, height = skyline_pack(sizes, width)
+        if height <= width * 1.05:
+            break
+        width = max(max(w for w, _h in sizes), width * math.sqrt(height / width))
+    return positions, max(width, height)
+
+def apply_uv_scale(obj, scale, keep_islands):
+    """Bring solver UVs to world scale, by box projection or per-island rescaling."""
+    if keep_islands:
+        rescale_uv_islands(obj, scale)
     else:
-        return 1, 2
+        project_world_uvs(obj, scale)
+
+def select_all_for_unwrap(obj):
+    """Select every face of an object in Edit Mode and make sure it has a UV layer."""
+    bm = bmesh.from_edit_mesh(obj.data)
+    bm.loops.layers.uv.verify()
+    for f in bm.faces:
+        f.select_set(True)
+
+def run_unwrap(method):
+    """Unwrap every mesh currently in Edit Mode.
+
+    Returns (status_message, cancelled). Exceptions from the operators propagate.
+    Islands the solver could not solve are found afterwards by find_failed_islands.
+    """
+    if method == 'SMART_PROJECT':
+        bpy.ops.uv.smart_project(angle_limit=66, island_margin=0.01)
+        return "✅ Smart UV Project completed", False
+
+    result = bpy.ops.uv.unwrap(method=method, margin=0.001)
+    if 'CANCELLED' in result:
+        return "❌ Unwrap failed completely.\nTry adding seams or Smart UV Project.", True
+    return "✅ Unwrap completed", False
+
+def find_failed_islands(obj):
+    """Inspect the active UV layer for islands the solver failed on.
+
+    An island fails when any of its UVs is NaN/inf, or when its share of the
+    total UV area collapsed to (near) zero although its faces have a share of
+    the world area.
+    Returns (per-face bool mask of failed faces, island count, failed island count).
+    """
+    import numpy as np
+    mesh = obj.data
+    uv_layer = mesh.uv_layers.active
+    n_faces = len(mesh.polygons)
+    if uv_layer is None or not n_faces:
+        return np.zeros(n_faces, dtype=bool), 0, 0
+
+    loop_verts, loop_face, loop_next = read_mesh_topology(mesh)
+    uvs = read_uvs(uv_layer).astype(np.float64)
+    bad_loop = ~np.isfinite(uvs).all(axis=1)
+    uvs = np.nan_to_num(uvs, nan=0.0, posinf=0.0, neginf=0.0)
+
+    labels = uv_island_labels(loop_verts, loop_face, loop_next, uvs, n_faces)
+    n_islands = int(labels.max()) + 1
+
+    world_area = face_world_areas(world_positions(obj), loop_verts, loop_face, loop_next, n_faces)
+    uv_area = face_uv_areas(uvs, loop_face, loop_next, n_faces)
+    island_world = np.bincount(labels, world_area, minlength=n_islands)
+    island_uv = np.bincount(labels, uv_area, minlength=n_islands)
+    island_bad = np.bincount(labels[loop_face], bad_loop, minlength=n_islands) > 0
+
+    # Compare each island's share of the UV area with its share of the world area,
+    # so neither the world scale nor the solver's 0-1 normalisation matters.
+    total_world = island_world.sum()
+    total_uv = island_uv.sum()
+    collapsed = ((island_world > 1e-12 * total_world)
+                 & (island_uv * total_world <= 1e-8 * island_world * total_uv))
+    failed = island_bad | collapsed
+    return failed[labels], n_islands, int(failed.sum())
+
+def select_faces(mesh, face_mask):
+    """Replace the mesh selection with the faces in face_mask (Object Mode)."""
+    import numpy as np
+    loop_verts, loop_face, _loop_next = read_mesh_topology(mesh)
+    loop_edges = np.empty(len(mesh.loops), dtype=np.int32)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    loop_selected = face_mask[loop_face]
+    vert_select = np.zeros(len(mesh.vertices), dtype=bool)
+    vert_select[loop_verts[loop_selected]] = True
+    edge_select = np.zeros(len(mesh.edges), dtype=bool)
+    edge_select[loop_edges[loop_selected]] = True
 
-def object_change_handler(scene, depsgraph):
+    mesh.vertices.foreach_set("select", vert_select)
+    mesh.edges.foreach_set("select", edge_select)
+    mesh.polygons.foreach_set("select", face_mask)
+    mesh.update()
+
+def failed_islands_message(n_failed, n_islands):
+    return f"❌ Unwrap completed, but {n_failed} of {n_islands} islands failed.\nCheck seams or try Smart UV."
+
+def selected_mesh_users(context):
+    """Map each selected mesh datablock to all scene objects using it, selected ones first."""
+    users = {}
+    for obj in context.selected_objects:
+        if obj.type == 'MESH':
+            users.setdefault(obj.data, []).append(obj)
+    for obj in context.scene.objects:
+        if obj.type == 'MESH' and obj.data in users and obj not in users[obj.data]:
+            users[obj.data].append(obj)
+    return users
+
+def on_active_object_changed():
+    """Recall the stored scale when the active object changes (msgbus callback)."""
     global last_object_id_global
-    props = scene.uvwrap_props
-    obj = bpy.context.active_object
+    context = bpy.context
+    if context.scene is None or context.view_layer is None:
+        return
+    obj = context.view_layer.objects.active
+
+    obj_id = obj.session_uid if obj else None
+    if obj_id == last_object_id_global:
+        return
+    last_object_id_global = obj_id
 
-    obj_id = str(id(obj)) if obj else ""
-    if obj_id != last_object_id_global:
-        last_object_id_global = obj_id
+    # Only write properties that actually change, so no extra updates are triggered.
+    props = context.scene.uvwrap_props
+    if props.status_message:
         props.status_message = ""
-        if obj and obj.type == 'MESH':
-            stored = obj.get("uvwrap_scale", None)
-            props.scale = stored if stored is not None else 1.0
+    if obj and obj.type == 'MESH':
+        stored = obj.get("uvwrap_scale", None)
+        scale = stored if stored is not None else 1.0
+        if abs(props.scale - scale) > 1e-6:
+            props.scale = scale
+
+def subscribe_active_object():
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    bpy.msgbus.subscribe_rna(
+        key=(bpy.types.LayerObjects, "active"),
+        owner=_msgbus_owner,
+        args=(),
+        notify=on_active_object_changed,
+    )
+
+@persistent
+def load_post_handler(dummy):
+    # Message bus subscriptions are dropped whenever a file is loaded.
+    subscribe_active_object()
+
+def unwrap_object(context, obj, method, scale, keep_islands, select_failed=False):
+    """Unwrap the active object and bring its UVs to 1 UV unit = scale meters.
+
+    Ends in Object Mode. Returns (status_message, cancelled, failed island count).
+    """
+    if method == 'WORLD_PROJECT':
+        if context.mode != 'OBJECT':
+            with Instrumentation.phase("mode_set"):
+                bpy.ops.object.mode_set(mode='OBJECT')
+        with Instrumentation.phase("projection"):
+            project_world_uvs(obj, scale)
+        return "✅ World projection completed", False, 0
+
+    with Instrumentation.phase("mode_set"):
+        bpy.ops.object.mode_set(mode='EDIT')
+        select_all_for_unwrap(obj)
+
+    with Instrumentation.phase("unwrap"):
+        try:
+            status, cancelled = run_unwrap(method)
+        except Exception as e:
+            status, cancelled = f"❌ Unwrap failed: {str(e)}", True
+
+    with Instrumentation.phase("mode_set"):
+        bpy.ops.object.mode_set(mode='OBJECT')
+    if cancelled:
+        return status, True, 0
+
+    with Instrumentation.phase("check"):
+        failed_mask, n_islands, n_failed = find_failed_islands(obj)
+    if n_failed:
+        status = failed_islands_message(n_failed, n_islands)
+        if select_failed:
+            select_faces(obj.data, failed_mask)
+
+    with Instrumentation.phase("projection"):
+        apply_uv_scale(obj, scale, keep_islands)
+    return status, False, n_failed
+
+def run_unwrap_worker(job_path):
+    """Worker entry point: unwrap the job's objects and save their UVs as .npy files."""
+    import os
+    import numpy as np
+    from . import Workers
+
+    job = Workers.load_job(job_path)
+    context = bpy.context
+    view_layer = context.view_layer
+    for other in view_layer.objects:
+        other.select_set(False)
+
+    for index, name in enumerate(job["objects"]):
+        start = time.perf_counter()
+        obj = bpy.data.objects.get(name)
+        if obj is None or obj.type != 'MESH':
+            Workers.emit(object=name, ok=False, error="Mesh object not found in snapshot")
+            continue
+        try:
+            obj.select_set(True)
+            view_layer.objects.active = obj
+            # Face selection stores the failed-island mask before projection moves those UVs.
+            status, cancelled, n_failed = unwrap_object(
+                context, obj, job["method"], job["scale"], job["keep_islands"], select_failed=True)
+            obj.select_set(False)
+            if cancelled:
+                Workers.emit(object=name, ok=False, error=status)
+                continue
+            base = f"{os.path.splitext(job_path)[0]}_{index}"
+            np.save(base + ".npy", read_uvs(obj.data.uv_layers.active))
+            failed_file = ""
+            if n_failed:
+                failed_file = base + "_failed.npy"
+                mask = np.zeros(len(obj.data.polygons), dtype=bool)
+                obj.data.polygons.foreach_get("select", mask)
+                np.save(failed_file, mask)
+        except Exception as e:
+            Workers.emit(object=name, ok=False, error=str(e))
+        else:
+            Workers.emit(object=name, ok=True, file=base + ".npy", failed_file=failed_file,
+                         failed_islands=n_failed, seconds=time.perf_counter() - start)
 
 # --------------------------
-# Operator
+# Operators
 # --------------------------
 
-class UVWRAP_OT_UnwrapBase(bpy.types.Operator):
-    bl_idname = "uvwrap.unwrap_base"
-    bl_label = "UVwrap Base"
-    bl_options = {'UNDO', 'INTERNAL'}
+class UVWRAP_UnwrapOptions:
+    """Properties shared by the unwrap operators."""
 
     unwrap_method: bpy.props.EnumProperty(
         name="Unwrap Method",
-        items=[
-            ('ANGLE_BASED', 'Angle Based', 'Organic meshes'),
-            ('CONFORMAL', 'Conformal', 'Hard-surface meshes'),
-            ('SMART_PROJECT', 'Smart UV Project', 'Blender’s Smart UV Project')
-        ],
+        items=UNWRAP_METHODS,
         default='ANGLE_BASED'
     )
 
@@ -70,6 +519,24 @@ class UVWRAP_OT_UnwrapBase(bpy.types.Operator):
         min=0.001
     )
 
+    keep_islands: bpy.props.BoolProperty(
+        name="Keep Islands",
+        description="Keep the solver's islands and rescale each one to the target scale instead of box-projecting",
+        default=False
+    )
+
+    select_failed: bpy.props.BoolProperty(
+        name="Select Failed Islands",
+        description="Select the faces of islands the solver failed on",
+        default=False
+    )
+
+
+class UVWRAP_OT_UnwrapBase(UVWRAP_UnwrapOptions, bpy.types.Operator):
+    bl_idname = "uvwrap.unwrap_base"
+    bl_label = "UVwrap Base"
+    bl_options = {'UNDO', 'INTERNAL'}
+
     def invoke(self, context, event):
         return self.execute(context)
 
@@ -82,51 +549,404 @@ class UVWRAP_OT_UnwrapBase(bpy.types.Operator):
             return {'CANCELLED'}
 
         obj["uvwrap_scale"] = self.scale
+        Instrumentation.count("objects", 1)
+        Instrumentation.count("faces", len(obj.data.polygons))
 
-        bpy.ops.object.mode_set(mode='EDIT')
-        bm = bmesh.from_edit_mesh(obj.data)
-        uv_layer = bm.loops.layers.uv.verify()
-        for f in bm.faces:
-            f.select_set(True)
+        props.status_message, cancelled, n_failed = unwrap_object(
+            context, obj, self.unwrap_method, self.scale, self.keep_islands, self.select_failed)
+        if cancelled:
+            return {'CANCELLED'}
 
-        try:
-            old_stdout = sys.stdout
-            sys.stdout = buffer = io.StringIO()
+        if n_failed and self.select_failed:
+            bpy.ops.object.mode_set(mode='EDIT')
+            context.tool_settings.mesh_select_mode = (False, False, True)
+        return {'FINISHED'}
 
-            if self.unwrap_method == 'SMART_PROJECT':
-                bpy.ops.uv.smart_project(angle_limit=66, island_margin=0.01)
-                props.status_message = "✅ Smart UV Project completed"
-            else:
-                result = bpy.ops.uv.unwrap(method=self.unwrap_method, margin=0.001)
-                output = buffer.getvalue()
-                if "Unwrap failed to solve" in output:
-                    props.status_message = "❌ Unwrap completed, but some islands failed.\nCheck seams or try Smart UV."
-                elif 'CANCELLED' in result:
-                    props.status_message = "❌ Unwrap failed completely.\nTry adding seams or Smart UV Project."
-                    bpy.ops.object.mode_set(mode='OBJECT')
-                    sys.stdout = old_stdout
-                    return {'CANCELLED'}
+
+class UVWRAP_OT_UnwrapBatch(UVWRAP_UnwrapOptions, bpy.types.Operator):
+    bl_idname = "uvwrap.unwrap_batch"
+    bl_label = "UVwrap Selected"
+    bl_description = "Unwrap all selected meshes, and objects sharing their mesh data, in one pass"
+    bl_options = {'UNDO', 'INTERNAL'}
+
+    def invoke(self, context, event):
+        return self.execute(context)
+
+    def execute(self, context):
+        props = context.scene.uvwrap_props
+        users = selected_mesh_users(context)
+        if not users:
+            self.report({'WARNING'}, "Please select at least one mesh object.")
+            props.status_message = "⚠ No mesh objects selected."
+            return {'CANCELLED'}
+
+        start = time.perf_counter()
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        if self.unwrap_method == 'WORLD_PROJECT':
+            status = "✅ World projection completed"
+        else:
+            # One multi-object Edit Mode session unwraps every unique mesh at once.
+            active = context.view_layer.objects.active
+            if active is None or active.type != 'MESH' or not active.select_get():
+                context.view_layer.objects.active = next(iter(users.values()))[0]
+            with Instrumentation.phase("mode_set"):
+                bpy.ops.object.mode_set(mode='EDIT')
+                for obj in context.objects_in_mode_unique_data:
+                    select_all_for_unwrap(obj)
+
+            with Instrumentation.phase("unwrap"):
+                try:
+                    status, cancelled = run_unwrap(self.unwrap_method)
+                except Exception as e:
+                    status, cancelled = f"❌ Unwrap failed: {str(e)}", True
+            with Instrumentation.phase("mode_set"):
+                bpy.ops.object.mode_set(mode='OBJECT')
+
+            if cancelled:
+                props.status_message = status
+                return {'CANCELLED'}
+        unwrap_time = time.perf_counter() - start
+
+        timings = []
+        failures = []
+        failed_islands = []
+        for mesh, objects in users.items():
+            owner = objects[0]
+            t = time.perf_counter()
+            try:
+                if self.unwrap_method == 'WORLD_PROJECT':
+                    project_world_uvs(owner, self.scale)
                 else:
-                    props.status_message = "✅ Unwrap completed"
+                    failed_mask, n_islands, n_failed = find_failed_islands(owner)
+                    if n_failed:
+                        failed_islands.append((owner.name, n_failed, n_islands))
+                        if self.select_failed:
+                            select_faces(mesh, failed_mask)
+                    apply_uv_scale(owner, self.scale, self.keep_islands)
+            except Exception as e:
+                failures.append((owner.name, str(e)))
+                continue
+            for obj in objects:
+                obj["uvwrap_scale"] = self.scale
+            seconds = time.perf_counter() - t
+            timings.append((owner.name, len(objects), seconds))
+            Instrumentation.add_phase(f"projection:{owner.name}", seconds)
+            Instrumentation.count("objects", len(objects))
+            Instrumentation.count("faces", len(mesh.polygons))
 
-            sys.stdout = old_stdout
+        total = time.perf_counter() - start
+        print(f"\n--- UVwrap Batch ({self.unwrap_method}) ---")
+        print(f"Unwrap pass: {unwrap_time:.3f}s for {len(users)} mesh(es)")
+        for name, count, seconds in sorted(timings, key=lambda x: x[2], reverse=True):
+            print(f"{name} ({count} user(s)): {seconds * 1000:.1f} ms")
+        for name, error in failures:
+            print(f"FAILED {name}: {error}")
+        for name, n_failed, n_islands in failed_islands:
+            print(f"{name}: {n_failed} of {n_islands} islands failed to unwrap")
 
-        except Exception as e:
-            sys.stdout = old_stdout
-            props.status_message = f"❌ Unwrap failed: {str(e)}"
+        summary = f"{len(timings)} mesh(es) in {total:.2f}s"
+        if failures:
+            props.status_message = f"❌ {summary}, {len(failures)} failed.\nSee console for details."
+            self.report({'WARNING'}, f"UVwrap: {summary}, {len(failures)} failed")
+        elif failed_islands:
+            n_failed = sum(x[1] for x in failed_islands)
+            props.status_message = (f"❌ {summary}, {n_failed} island(s) failed in "
+                                    f"{len(failed_islands)} mesh(es).\nCheck seams or try Smart UV.")
+            self.report({'WARNING'}, f"UVwrap: {summary}, {n_failed} island(s) failed")
+        else:
+            props.status_message = f"{status}\n✅ {summary}"
+            self.report({'INFO'}, f"UVwrap: {summary}")
+        return {'FINISHED'}
+
+class UVWRAP_OT_UnwrapParallel(UVWRAP_UnwrapOptions, bpy.types.Operator):
+    bl_idname = "uvwrap.unwrap_parallel"
+    bl_label = "UVwrap Selected (Parallel)"
+    bl_description = "Unwrap selected meshes in background Blender processes and merge the UVs back"
+    bl_options = {'UNDO', 'INTERNAL'}
+
+    worker_count: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of background Blender processes (0 = one per CPU core)",
+        default=0,
+        min=0
+    )
+
+    _timer = None
+    _pool = None
+
+    def start(self, context):
+        from . import Workers
+
+        props = context.scene.uvwrap_props
+        users = selected_mesh_users(context)
+        if not users:
+            self.report({'WARNING'}, "Please select at least one mesh object.")
+            props.status_message = "⚠ No mesh objects selected."
+            return False
+
+        if context.mode != 'OBJECT':
             bpy.ops.object.mode_set(mode='OBJECT')
+
+        # Workers unwrap one owner per mesh datablock; results go to all its users.
+        self._users = {objects[0].name: objects for objects in users.values()}
+        count = self.worker_count or Workers.default_worker_count()
+        jobs = [
+            {"objects": chunk, "method": self.unwrap_method, "scale": self.scale, "keep_islands": self.keep_islands}
+            for chunk in Workers.split_evenly(list(self._users), count)
+        ]
+
+        self._pool = Workers.WorkerPool("UVwrap", "run_unwrap_worker", jobs)
+        try:
+            with Instrumentation.phase("start_workers"):
+                self._pool.start()
+        except (OSError, RuntimeError) as e:
+            self._pool.terminate()
+            self._pool.cleanup()
+            self.report({'ERROR'}, f"Could not start unwrap workers: {e}")
+            return False
+
+        self._start = time.perf_counter()
+        self._done = 0
+        self._failures = []
+        self._failed_islands = 0
+        return True
+
+    def merge(self, messages):
+        import numpy as np
+        for message in messages:
+            self._done += 1
+            name = message["object"]
+            if not message.get("ok"):
+                self._failures.append((name, message.get("error", "")))
+                continue
+
+            objects = self._users[name]
+            mesh = objects[0].data
+            uvs = np.load(message["file"])
+            if len(uvs) != len(mesh.loops):
+                self._failures.append((name, "Mesh changed while unwrapping"))
+                continue
+
+            uv_layer = mesh.uv_layers.active or mesh.uv_layers.new()
+            uv_layer.data.foreach_set("uv", uvs.ravel())
+            mesh.update()
+            for obj in objects:
+                obj["uvwrap_scale"] = self.scale
+            if self.select_failed and message.get("failed_file"):
+                select_faces(mesh, np.load(message["failed_file"]))
+
+            self._failed_islands += message.get("failed_islands", 0)
+            Instrumentation.add_phase(f"unwrap:{name}", message.get("seconds", 0.0))
+            Instrumentation.count("objects", len(objects))
+            Instrumentation.count("faces", len(mesh.polygons))
+
+    def finish(self, context, cancelled=False):
+        self._pool.cleanup()
+        props = context.scene.uvwrap_props
+
+        for name, error in self._failures:
+            print(f"UVwrap: FAILED {name}: {error}")
+
+        total = len(self._users)
+        summary = f"{self._done - len(self._failures)} of {total} mesh(es) in {time.perf_counter() - self._start:.2f}s"
+        if cancelled:
+            props.status_message = f"❌ Cancelled after {summary}"
+            self.report({'WARNING'}, f"UVwrap: cancelled after {summary}")
+        elif self._failures or self._failed_islands:
+            props.status_message = (f"❌ {summary}, {len(self._failures)} failed, "
+                                    f"{self._failed_islands} island(s) failed.\nSee console for details.")
+            self.report({'WARNING'}, f"UVwrap: {summary}, {len(self._failures)} failed")
+        else:
+            props.status_message = f"✅ {summary}"
+            self.report({'INFO'}, f"UVwrap: {summary}")
+
+    def execute(self, context):
+        if not self.start(context):
             return {'CANCELLED'}
 
-        for face in bm.faces:
-            u_axis, v_axis = get_best_uv_axes(face.normal)
-            for loop in face.loops:
-                co = obj.matrix_world @ loop.vert.co
-                uv = loop[uv_layer].uv
-                uv.x = co[u_axis] / self.scale
-                uv.y = co[v_axis] / self.scale
+        while True:
+            running = self._pool.running()
+            self.merge(self._pool.poll())
+            if not running:
+                break
+            time.sleep(0.1)
 
-        bmesh.update_edit_mesh(obj.data)
-        bpy.ops.object.mode_set(mode='OBJECT')
+        self.finish(context)
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        if not self.start(context):
+            return {'CANCELLED'}
+
+        wm = context.window_manager
+        self._timer = wm.event_timer_add(0.2, window=context.window)
+        wm.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            self._pool.terminate()
+            context.window_manager.event_timer_remove(self._timer)
+            self.merge(self._pool.poll())
+            self.finish(context, cancelled=True)
+            return {'CANCELLED'}
+
+        if event.type != 'TIMER':
+            return {'PASS_THROUGH'}
+
+        running = self._pool.running()
+        self.merge(self._pool.poll())
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                area.tag_redraw()
+        if running:
+            return {'PASS_THROUGH'}
+
+        context.window_manager.event_timer_remove(self._timer)
+        self.finish(context)
+        return {'FINISHED'}
+
+
+class UVWRAP_OT_AnalyzeDensity(bpy.types.Operator):
+    bl_idname = "uvwrap.analyze_density"
+    bl_label = "Analyze Texel Density"
+    bl_description = "Compare UV area to world area per face on all selected meshes against their stored scale"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        import numpy as np
+        props = context.scene.uvwrap_props
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            self.report({'WARNING'}, "Please select at least one mesh object.")
+            return {'CANCELLED'}
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        low = 1.0 / (1.0 + props.density_tolerance)
+        high = 1.0 + props.density_tolerance
+        histogram = np.zeros(len(DENSITY_BIN_LABELS), dtype=np.int64)
+        rows = []
+        for obj in objects:
+            ratios = face_density_ratios(obj, obj.get("uvwrap_scale", props.scale))
+            valid = np.isfinite(ratios)
+            histogram += np.bincount(np.searchsorted(DENSITY_BIN_EDGES, ratios[valid], side='right'),
+                                     minlength=len(DENSITY_BIN_LABELS))
+            outliers = valid & ((ratios < low) | (ratios > high))
+            median = float(np.median(ratios[valid])) if valid.any() else 0.0
+            rows.append((obj.name, int(outliers.sum()), int(valid.sum()), median))
+            if props.select_outliers:
+                select_faces(obj.data, outliers)
+            Instrumentation.count("faces", len(ratios))
+
+        rows.sort(key=lambda x: x[1], reverse=True)
+        _density_reports[context.scene.name] = {"histogram": histogram.tolist(), "objects": rows}
+
+        n_outliers = sum(row[1] for row in rows)
+        n_faces = sum(row[2] for row in rows)
+        self.report({'INFO'}, f"{n_outliers} of {n_faces} faces outside ±{props.density_tolerance:.0%} of target density")
+        return {'FINISHED'}
+
+
+class UVWRAP_OT_NormalizeDensity(bpy.types.Operator):
+    bl_idname = "uvwrap.normalize_density"
+    bl_label = "Normalize Texel Density"
+    bl_description = "Rescale every UV island of the selected meshes back to each object's stored UVwrap scale"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        props = context.scene.uvwrap_props
+        users = selected_mesh_users(context)
+        if not users:
+            self.report({'WARNING'}, "Please select at least one mesh object.")
+            return {'CANCELLED'}
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        n_islands = 0
+        for mesh, objects in users.items():
+            owner = objects[0]
+            n_islands += rescale_uv_islands(owner, owner.get("uvwrap_scale", props.scale))
+            Instrumentation.count("faces", len(mesh.polygons))
+
+        self.report({'INFO'}, f"Rescaled {n_islands} island(s) on {len(users)} mesh(es)")
+        return {'FINISHED'}
+
+class UVWRAP_OT_PackAtlas(bpy.types.Operator):
+    bl_idname = "uvwrap.pack_atlas"
+    bl_label = "Pack Atlas"
+    bl_description = ("Pack the UV islands of all selected meshes into one 0-1 atlas on a second UV layer, "
+                      "keeping their relative texel density")
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        import numpy as np
+        props = context.scene.uvwrap_props
+        users = selected_mesh_users(context)
+        if not users:
+            self.report({'WARNING'}, "Please select at least one mesh object.")
+            return {'CANCELLED'}
+
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        # Collect islands in meters so objects with different stored scales stay consistent.
+        with Instrumentation.phase("collect"):
+            meshes = []
+            sizes = []
+            for mesh, objects in users.items():
+                source = mesh.uv_layers.active
+                if source is None or not len(mesh.polygons) or source.name == props.atlas_uv_name:
+                    continue
+                loop_verts, loop_face, loop_next = read_mesh_topology(mesh)
+                uvs = read_uvs(source).astype(np.float64) * objects[0].get("uvwrap_scale", props.scale)
+                # new() returns None once a mesh has the maximum number of UV maps.
+                if (mesh.uv_layers.get(props.atlas_uv_name) is None
+                        and mesh.uv_layers.new(name=props.atlas_uv_name, do_init=False) is None):
+                    self.report({'WARNING'}, f"'{mesh.name}' has no free UV map slot for "
+                                             f"'{props.atlas_uv_name}', skipped")
+                    continue
+                labels = uv_island_labels(loop_verts, loop_face, loop_next, uvs, len(mesh.polygons))
+                loop_island = labels[loop_face]
+                n_islands = int(labels.max()) + 1
+
+                lo = np.full((n_islands, 2), np.inf)
+                hi = np.full((n_islands, 2), -np.inf)
+                for axis in range(2):
+                    np.minimum.at(lo[:, axis], loop_island, uvs[:, axis])
+                    np.maximum.at(hi[:, axis], loop_island, uvs[:, axis])
+
+                meshes.append((mesh, uvs, loop_island, lo, len(sizes)))
+                sizes.extend(map(tuple, hi - lo))
+
+        if not sizes:
+            self.report({'WARNING'}, "No UVs to pack on the selected meshes.")
+            return {'CANCELLED'}
+
+        # Margin is given in pixels, so it depends on the final atlas size: pack twice.
+        with Instrumentation.phase("pack"):
+            margin = props.atlas_margin / props.atlas_resolution
+            _positions, side = pack_square(sizes)
+            for _ in range(2):
+                pad = margin * side
+                positions, side = pack_square([(w + 2 * pad, h + 2 * pad) for w, h in sizes])
+        Instrumentation.count("islands", len(sizes))
+
+        with Instrumentation.phase("write"):
+            offsets = np.array(positions) + pad
+            for mesh, uvs, loop_island, lo, first in meshes:
+                island_offset = offsets[first:first + len(lo)]
+                atlas_uvs = (uvs - lo[loop_island] + island_offset[loop_island]) / side
+                atlas = mesh.uv_layers[props.atlas_uv_name]
+                atlas.data.foreach_set("uv", atlas_uvs.astype(np.float32).ravel())
+                mesh.update()
+
+        self.report({'INFO'}, f"Packed {len(sizes)} island(s) from {len(meshes)} mesh(es) into '{props.atlas_uv_name}'")
         return {'FINISHED'}
 
 # --------------------------
@@ -152,6 +972,18 @@ class UVWRAP_PT_Panel(bpy.types.Panel):
                 info.label(text=f"Stored Scale: {stored:.3f}", icon='INFO')
 
         layout.prop(props, "scale", text="World to UV Scale", icon='SORTSIZE')
+        row = layout.row(align=True)
+        row.prop(props, "batch_selected")
+        sub = row.row(align=True)
+        sub.enabled = props.batch_selected
+        sub.prop(props, "use_parallel", text="Parallel")
+        if props.batch_selected and props.use_parallel:
+            layout.prop(props, "worker_count")
+            op_id = "uvwrap.unwrap_parallel"
+        elif props.batch_selected:
+            op_id = "uvwrap.unwrap_batch"
+        else:
+            op_id = "uvwrap.unwrap_base"
 
         row = layout.row(align=True)
         col1 = row.column(align=True)
@@ -166,17 +998,30 @@ class UVWRAP_PT_Panel(bpy.types.Panel):
         col2.label(text="Hard Surface")
         col3.label(text="UV Project")
 
-        op = col1.operator("uvwrap.unwrap_base", text="Angle", icon='UV')
+        op = col1.operator(op_id, text="Angle", icon='UV')
         op.unwrap_method = 'ANGLE_BASED'
         op.scale = props.scale
+        op.keep_islands = props.keep_islands
+        op.select_failed = props.select_failed
 
-        op = col2.operator("uvwrap.unwrap_base", text="Conformal", icon='UV_DATA')
+        op = col2.operator(op_id, text="Conformal", icon='UV_DATA')
         op.unwrap_method = 'CONFORMAL'
         op.scale = props.scale
+        op.keep_islands = props.keep_islands
+        op.select_failed = props.select_failed
 
-        op = col3.operator("uvwrap.unwrap_base", text="Smart", icon='MOD_UVPROJECT')
+        op = col3.operator(op_id, text="Smart", icon='MOD_UVPROJECT')
         op.unwrap_method = 'SMART_PROJECT'
         op.scale = props.scale
+        op.keep_islands = props.keep_islands
+        op.select_failed = props.select_failed
+
+        row = layout.row(align=True)
+        op = row.operator(op_id, text="Box / World Projection", icon='VIEW_ORTHO')
+        op.unwrap_method = 'WORLD_PROJECT'
+        op.scale = props.scale
+        layout.prop(props, "keep_islands")
+        layout.prop(props, "select_failed")
 
         if props.status_message:
             box = layout.box()
@@ -184,6 +1029,63 @@ class UVWRAP_PT_Panel(bpy.types.Panel):
             for line in lines:
                 box.label(text=line, icon='INFO' if "✅" in props.status_message else 'ERROR')
 
+class UVWRAP_PT_Density(bpy.types.Panel):
+    bl_label = "Texel Density"
+    bl_idname = "UVWRAP_PT_density"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "DefaultCube"
+    bl_parent_id = "UVWRAP_PT_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.uvwrap_props
+        report = _density_reports.get(context.scene.name)
+
+        row = layout.row(align=True)
+        row.prop(props, "density_tolerance", slider=True)
+        row.prop(props, "select_outliers", text="", icon='RESTRICT_SELECT_OFF')
+        row = layout.row(align=True)
+        row.operator("uvwrap.analyze_density", text="Analyze", icon='VIEWZOOM')
+        row.operator("uvwrap.normalize_density", text="Normalize", icon='UV_SYNC_SELECT')
+
+        if not report:
+            return
+
+        box = layout.box()
+        col = box.column(align=True)
+        peak = max(report["histogram"]) or 1
+        for label, count in zip(DENSITY_BIN_LABELS, report["histogram"]):
+            bar = "█" * round(20 * count / peak)
+            col.label(text=f"{label:>11}  {bar} {count:,}")
+
+        outliers = [row for row in report["objects"] if row[1]]
+        if outliers:
+            box = layout.box()
+            box.label(text="Outliers by Object")
+            for name, n_outliers, n_faces, median in outliers[:8]:
+                box.label(text=f"{name}: {n_outliers:,}/{n_faces:,} faces, median {median:.2f}x", icon='ERROR')
+
+class UVWRAP_PT_Atlas(bpy.types.Panel):
+    bl_label = "Atlas"
+    bl_idname = "UVWRAP_PT_atlas"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "DefaultCube"
+    bl_parent_id = "UVWRAP_PT_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        props = context.scene.uvwrap_props
+
+        layout.prop(props, "atlas_uv_name")
+        row = layout.row(align=True)
+        row.prop(props, "atlas_resolution")
+        row.prop(props, "atlas_margin")
+        layout.operator("uvwrap.pack_atlas", icon='UV_ISLANDSEL')
+
 # --------------------------
 # Properties
 # --------------------------
@@ -199,6 +1101,62 @@ class UVWRAP_Props(bpy.types.PropertyGroup):
         name="Status Message",
         default=""
     )
+    keep_islands: bpy.props.BoolProperty(
+        name="Keep Solver Islands",
+        description="Rescale each unwrapped island to the target scale instead of box-projecting over it",
+        default=False
+    )
+    select_failed: bpy.props.BoolProperty(
+        name="Select Failed Islands",
+        description="After unwrapping, select the faces of islands the solver failed on",
+        default=False
+    )
+    density_tolerance: bpy.props.FloatProperty(
+        name="Tolerance",
+        description="Faces whose texel density differs from the target by more than this are outliers",
+        default=0.25,
+        min=0.01,
+        max=1.0,
+        subtype='FACTOR'
+    )
+    select_outliers: bpy.props.BoolProperty(
+        name="Select Outliers",
+        description="Select faces outside the tolerance when analyzing",
+        default=False
+    )
+    atlas_uv_name: bpy.props.StringProperty(
+        name="Atlas UV Map",
+        description="UV layer the packed atlas is written to",
+        default="UVAtlas"
+    )
+    atlas_resolution: bpy.props.IntProperty(
+        name="Resolution",
+        description="Atlas texture size in pixels, used to convert the margin",
+        default=2048,
+        min=64
+    )
+    atlas_margin: bpy.props.IntProperty(
+        name="Margin",
+        description="Space around each island in pixels",
+        default=4,
+        min=0
+    )
+    batch_selected: bpy.props.BoolProperty(
+        name="All Selected Objects",
+        description="Unwrap every selected mesh in one pass instead of only the active object",
+        default=False
+    )
+    use_parallel: bpy.props.BoolProperty(
+        name="Parallel Unwrap",
+        description="Unwrap selected meshes in background Blender processes",
+        default=False
+    )
+    worker_count: bpy.props.IntProperty(
+        name="Workers",
+        description="Number of background Blender processes (0 = one per CPU core)",
+        default=0,
+        min=0
+    )
 
 # --------------------------
 # Register
@@ -206,7 +1164,14 @@ class UVWRAP_Props(bpy.types.PropertyGroup):
 
 classes = (
     UVWRAP_OT_UnwrapBase,
+    UVWRAP_OT_UnwrapBatch,
+    UVWRAP_OT_UnwrapParallel,
+    UVWRAP_OT_AnalyzeDensity,
+    UVWRAP_OT_NormalizeDensity,
+    UVWRAP_OT_PackAtlas,
     UVWRAP_PT_Panel,
+    UVWRAP_PT_Density,
+    UVWRAP_PT_Atlas,
     UVWRAP_Props,
 )
 
@@ -214,14 +1179,16 @@ def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.uvwrap_props = bpy.props.PointerProperty(type=UVWRAP_Props)
-    bpy.app.handlers.depsgraph_update_post.append(object_change_handler)
+    subscribe_active_object()
+    bpy.app.handlers.load_post.append(load_post_handler)
 
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.uvwrap_props
-    if object_change_handler in bpy.app.handlers.depsgraph_update_post:
-        bpy.app.handlers.depsgraph_update_post.remove(object_change_handler)
+    bpy.msgbus.clear_by_owner(_msgbus_owner)
+    if load_post_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(load_post_handler)
 
 if __name__ == "__main__":
     register()
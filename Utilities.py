@@ -10,11 +10,16 @@ bl_info = {
 
 import bpy
 import bmesh
-import ctypes
 import sys
-from bpy.types import Operator, Panel, PropertyGroup
-from bpy.props import FloatProperty, PointerProperty
-from mathutils import Vector
+import time
+from bpy.app.handlers import persistent
+from bpy.types import Operator, Panel, PropertyGroup, UIList
+from bpy.props import (BoolProperty, CollectionProperty, EnumProperty, FloatProperty, IntProperty,
+                       PointerProperty, StringProperty)
+from bpy_extras.io_utils import ExportHelper
+from mathutils.kdtree import KDTree
+from . import Instrumentation
+from . import MeshGraph
 
 
 # ------------------------------------------------------------------------
@@ -23,11 +28,281 @@ from mathutils import Vector
 
 def open_console_if_needed():
     if sys.platform == "win32":
+        import ctypes
         hwnd = ctypes.windll.kernel32.GetConsoleWindow()
         if not hwnd:
             ctypes.windll.kernel32.AllocConsole()
 
 
+# ------------------------------------------------------------------------
+#   Element counts
+# ------------------------------------------------------------------------
+
+# (verts, edges, faces, tris) keyed by ID session_uid. Objects with modifiers
+# are cached per object, plain meshes per datablock so instances share one
+# entry. Entries are dropped by count_cache_handler on geometry updates, by
+# prune_counts once their ID is deleted, and all at once when a file loads.
+_object_counts = {}
+_mesh_counts = {}
+
+def mesh_counts(mesh):
+    import numpy as np
+    loop_totals = np.empty(len(mesh.polygons), dtype=np.int64)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    tris = int(loop_totals.sum()) - 2 * len(loop_totals)
+    return len(mesh.vertices), len(mesh.edges), len(mesh.polygons), tris
+
+def element_counts(obj, depsgraph):
+    """Vertex, edge, face and triangle counts of a mesh object as displayed."""
+    if obj.mode == 'EDIT' or any(m.show_viewport for m in obj.modifiers):
+        counts = _object_counts.get(obj.session_uid)
+        if counts is None:
+            counts = mesh_counts(obj.evaluated_get(depsgraph).data)
+            _object_counts[obj.session_uid] = counts
+        return counts
+
+    mesh = obj.data
+    counts = _mesh_counts.get(mesh.session_uid)
+    if counts is None:
+        counts = mesh_counts(mesh)
+        _mesh_counts[mesh.session_uid] = counts
+    return counts
+
+@persistent
+def count_cache_handler(scene, depsgraph):
+    if not _object_counts and not _mesh_counts:
+        return
+    for update in depsgraph.updates:
+        if update.is_updated_geometry:
+            uid = update.id.original.session_uid
+            _object_counts.pop(uid, None)
+            _mesh_counts.pop(uid, None)
+
+@persistent
+def count_cache_load_handler(*_args):
+    _object_counts.clear()
+    _mesh_counts.clear()
+
+def prune_counts():
+    """Drop cached counts of objects and meshes that no longer exist."""
+    if _object_counts:
+        alive = {obj.session_uid for obj in bpy.data.objects}
+        for uid in _object_counts.keys() - alive:
+            del _object_counts[uid]
+    if _mesh_counts:
+        alive = {mesh.session_uid for mesh in bpy.data.meshes}
+        for uid in _mesh_counts.keys() - alive:
+            del _mesh_counts[uid]
+
+
+# ------------------------------------------------------------------------
+#   Scene statistics
+# ------------------------------------------------------------------------
+
+STAT_FIELDS = ("objects", "verts", "tris", "materials", "draw_calls")
+
+# Last report per scene name, filled by UTILITIES_OT_scene_stats.
+_scene_stats = {}
+
+def _add_stats(table, key, row, materials):
+    entry = table.get(key)
+    if entry is None:
+        entry = table[key] = {"objects": 0, "verts": 0, "tris": 0, "draw_calls": 0, "_materials": set()}
+    for field in ("objects", "verts", "tris", "draw_calls"):
+        entry[field] += row[field]
+    entry["_materials"] |= materials
+
+def _finish_stats(table):
+    for entry in table.values():
+        entry["materials"] = len(entry.pop("_materials"))
+    return table
+
+def used_material_slots(obj, depsgraph):
+    """Indices of the material slots of obj that at least one polygon uses."""
+    import numpy as np
+    if obj.mode == 'EDIT' or any(m.show_viewport for m in obj.modifiers):
+        mesh = obj.evaluated_get(depsgraph).data
+    else:
+        mesh = obj.data
+    indices = np.empty(len(mesh.polygons), dtype=np.int32)
+    mesh.polygons.foreach_get("material_index", indices)
+    # Out of range indices render with the last slot.
+    return set(np.unique(np.clip(indices, 0, max(len(obj.material_slots) - 1, 0))).tolist())
+
+def scene_statistics(context):
+    """Aggregate verts, tris, materials and estimated draw calls in one evaluated pass.
+
+    Draw calls are estimated as one per material slot in use per object.
+    Returns per-object, per-collection and per-mesh-datablock tables plus totals.
+    """
+    depsgraph = context.evaluated_depsgraph_get()
+    prune_counts()
+    objects = {}
+    collections = {}
+    meshes = {}
+    totals = {}
+
+    for obj in context.scene.objects:
+        if obj.type != 'MESH':
+            continue
+        verts, _edges, faces, tris = element_counts(obj, depsgraph)
+        used = used_material_slots(obj, depsgraph) if faces else set()
+        slots = obj.material_slots
+        materials = {slots[i].material.name for i in used if i < len(slots) and slots[i].material}
+        row = {
+            "objects": 1,
+            "verts": verts,
+            "tris": tris,
+            "draw_calls": len(used),
+        }
+        objects[obj.name] = dict(row, materials=len(materials))
+        for collection in obj.users_collection:
+            _add_stats(collections, collection.name, row, materials)
+        _add_stats(meshes, obj.data.name, row, materials)
+        _add_stats(totals, "scene", row, materials)
+
+    return {
+        "objects": objects,
+        "collections": _finish_stats(collections),
+        "meshes": _finish_stats(meshes),
+        "totals": _finish_stats(totals).get("scene", dict.fromkeys(STAT_FIELDS, 0)),
+    }
+
+
+# ------------------------------------------------------------------------
+#   Shading
+# ------------------------------------------------------------------------
+
+AUTO_SMOOTH_GROUP = "Smooth by Angle"
+
+def set_smooth(mesh, smooth):
+    """Set every face of mesh smooth or flat in one write."""
+    import numpy as np
+    mesh.polygons.foreach_set("use_smooth", np.full(len(mesh.polygons), smooth, dtype=bool))
+    mesh.update()
+
+def is_auto_smooth(mod):
+    return mod.type == 'NODES' and mod.node_group is not None and mod.node_group.name.startswith(AUTO_SMOOTH_GROUP)
+
+def auto_smooth_template(context, objects):
+    """A Smooth by Angle modifier to copy from.
+
+    Uses one already on the objects, otherwise runs shade_auto_smooth once on
+    the first object so the node group is appended from the essentials.
+    """
+    for obj in objects:
+        for mod in obj.modifiers:
+            if is_auto_smooth(mod):
+                return mod
+
+    obj = objects[0]
+    with context.temp_override(active_object=obj, object=obj,
+                               selected_objects=[obj], selected_editable_objects=[obj]):
+        bpy.ops.object.shade_auto_smooth()
+    return next((mod for mod in obj.modifiers if is_auto_smooth(mod)), None)
+
+def apply_auto_smooth(context, objects):
+    """Give every object a Smooth by Angle modifier sharing the template's node group and inputs."""
+    template = auto_smooth_template(context, objects)
+    if template is None:
+        return False
+    for obj in objects:
+        mod = next((m for m in obj.modifiers if is_auto_smooth(m)), None)
+        if mod == template:
+            continue
+        if mod is None:
+            mod = obj.modifiers.new(template.name, 'NODES')
+        mod.node_group = template.node_group
+        for key in template.keys():
+            mod[key] = template[key]
+        mod.use_pin_to_last = template.use_pin_to_last
+    return True
+
+
+# ------------------------------------------------------------------------
+#   Mesh health
+# ------------------------------------------------------------------------
+
+HEALTH_FIELDS = ("non_manifold", "loose_verts", "zero_area", "flipped", "duplicates")
+
+# Faces below this area (in mesh units squared) count as degenerate.
+ZERO_AREA = 1e-10
+
+def _face_components(n_faces, face_a, face_b):
+    """Number of connected components of faces joined by (face_a, face_b) pairs."""
+    import numpy as np
+    return len(np.unique(MeshGraph.connected_components(n_faces, face_a, face_b)))
+
+def mesh_health(mesh):
+    """Count geometry problems of a mesh from bulk foreach_get arrays.
+
+    non_manifold: edges not shared by exactly two faces (boundary, wire, fans).
+    loose_verts: vertices not used by any edge.
+    zero_area: faces with (near) zero area.
+    flipped: face patches whose winding disagrees with the rest of their island.
+    duplicates: faces using the same vertices as another face.
+    """
+    import numpy as np
+    n_verts, n_edges, n_faces, n_loops = len(mesh.vertices), len(mesh.edges), len(mesh.polygons), len(mesh.loops)
+
+    co = np.empty(n_verts * 3, dtype=np.float64)
+    mesh.vertices.foreach_get("co", co)
+    co = co.reshape(-1, 3)
+    edge_verts = np.empty(n_edges * 2, dtype=np.int32)
+    mesh.edges.foreach_get("vertices", edge_verts)
+    loop_starts = np.empty(n_faces, dtype=np.int64)
+    loop_totals = np.empty(n_faces, dtype=np.int64)
+    mesh.polygons.foreach_get("loop_start", loop_starts)
+    mesh.polygons.foreach_get("loop_total", loop_totals)
+    loop_verts = np.empty(n_loops, dtype=np.int32)
+    loop_edges = np.empty(n_loops, dtype=np.int32)
+    mesh.loops.foreach_get("vertex_index", loop_verts)
+    mesh.loops.foreach_get("edge_index", loop_edges)
+
+    loop_face = np.repeat(np.arange(n_faces), loop_totals)
+    loop_next = np.arange(1, n_loops + 1)
+    loop_next[loop_starts + loop_totals - 1] = loop_starts
+
+    # Edge-face incidence: every face loop uses one edge.
+    edge_faces = np.bincount(loop_edges, minlength=n_edges)
+    used = np.zeros(n_verts, dtype=bool)
+    used[edge_verts] = True
+
+    cross = np.cross(co[loop_verts], co[loop_verts[loop_next]])
+    normal = np.column_stack([np.bincount(loop_face, cross[:, i], minlength=n_faces) for i in range(3)])
+    area = 0.5 * np.linalg.norm(normal, axis=1)
+
+    # The two loops of a manifold edge run in opposite directions when the
+    # faces agree on winding. Faces joined by consistent edges form patches;
+    # every patch beyond the first in a connected island is flipped.
+    order = np.argsort(loop_edges, kind='stable')
+    first = np.concatenate(([0], np.cumsum(edge_faces)[:-1]))
+    manifold = np.flatnonzero(edge_faces == 2)
+    loop_a = order[first[manifold]]
+    loop_b = order[first[manifold] + 1]
+    face_a = loop_face[loop_a]
+    face_b = loop_face[loop_b]
+    consistent = loop_verts[loop_a] != loop_verts[loop_b]
+    flipped = (_face_components(n_faces, face_a[consistent], face_b[consistent])
+               - _face_components(n_faces, face_a, face_b)) if n_faces else 0
+
+    duplicates = 0
+    for size in np.unique(loop_totals):
+        starts = loop_starts[loop_totals == size]
+        if len(starts) < 2:
+            continue
+        corners = np.sort(loop_verts[starts[:, None] + np.arange(size)], axis=1)
+        duplicates += len(corners) - len(np.unique(corners, axis=0))
+
+    return {
+        "non_manifold": int(np.count_nonzero(edge_faces != 2)),
+        "loose_verts": int(n_verts - np.count_nonzero(used)),
+        "zero_area": int(np.count_nonzero(area <= ZERO_AREA)),
+        "flipped": int(flipped),
+        "duplicates": int(duplicates),
+    }
+
+
 # ------------------------------------------------------------------------
 #   Operators
 # ------------------------------------------------------------------------
@@ -47,6 +322,7 @@ class UTILITIES_OT_toggle_console(Operator):
 
     def execute(self, context):
         if sys.platform == "win32":
+            import ctypes
             hwnd = ctypes.windll.kernel32.GetConsoleWindow()
             if hwnd:
                 visible = ctypes.windll.user32.IsWindowVisible(hwnd)
@@ -68,32 +344,125 @@ class UTILITIES_OT_count_elements(Operator):
         items=[
             ('VERT', "Vertex", ""),
             ('EDGE', "Edge", ""),
-            ('FACE', "Face", "")
+            ('FACE', "Face", ""),
+            ('TRI', "Triangle", "")
         ]
     )
 
     def execute(self, context):
         open_console_if_needed()
 
-        data_key = {
-            'VERT': 'vertices',
-            'EDGE': 'edges',
-            'FACE': 'polygons'
+        column = {
+            'VERT': 0,
+            'EDGE': 1,
+            'FACE': 2,
+            'TRI': 3
         }[self.mode]
 
-        results = []
-        for obj in context.scene.objects:
-            if obj.type == 'MESH':
-                eval_obj = obj.evaluated_get(bpy.context.evaluated_depsgraph_get())
-                mesh = eval_obj.to_mesh()
-                count = len(getattr(mesh, data_key))
-                results.append((obj.name, count))
-                eval_obj.to_mesh_clear()
-
-        results.sort(key=lambda x: x[1], reverse=True)
+        with Instrumentation.phase("depsgraph"):
+            depsgraph = context.evaluated_depsgraph_get()
+        with Instrumentation.phase("count"):
+            prune_counts()
+            results = []
+            for obj in context.scene.objects:
+                if obj.type == 'MESH':
+                    results.append((obj.name, element_counts(obj, depsgraph)))
+        Instrumentation.count("objects", len(results))
+
+        results.sort(key=lambda x: x[1][column], reverse=True)
         print(f"\n--- {self.mode} Count ---")
-        for name, count in results:
-            print(f"{name}: {count}")
+        for name, (verts, edges, faces, tris) in results:
+            print(f"{name}: {(verts, edges, faces, tris)[column]}"
+                  f"  (V {verts} / E {edges} / F {faces} / Tris {tris})")
+        return {'FINISHED'}
+
+
+class UTILITIES_OT_scene_stats(Operator):
+    bl_idname = "utilities.scene_stats"
+    bl_label = "Scene Budget"
+    bl_description = "Summarise tris, verts, materials and draw calls per object, collection and mesh"
+
+    def execute(self, context):
+        stats = scene_statistics(context)
+        _scene_stats[context.scene.name] = stats
+        totals = stats["totals"]
+        self.report({'INFO'}, f"{totals['objects']} objects, {totals['tris']:,} tris, "
+                              f"{totals['draw_calls']} draw calls")
+        return {'FINISHED'}
+
+
+class UTILITIES_OT_export_scene_stats(Operator, ExportHelper):
+    bl_idname = "utilities.export_scene_stats"
+    bl_label = "Export Scene Budget"
+    bl_description = "Write the scene budget report to a CSV or JSON file"
+
+    filename_ext = ".csv"
+    filter_glob: StringProperty(default="*.csv;*.json", options={'HIDDEN'})
+
+    file_format: EnumProperty(
+        name="Format",
+        items=[
+            ('CSV', "CSV", ""),
+            ('JSON', "JSON", "")
+        ],
+        default='CSV'
+    )
+
+    def check(self, context):
+        # ExportHelper forces filename_ext onto the path, so follow the chosen format.
+        self.filename_ext = ".json" if self.file_format == 'JSON' else ".csv"
+        return ExportHelper.check(self, context)
+
+    def execute(self, context):
+        import csv
+        import json
+        import os
+
+        stats = _scene_stats.get(context.scene.name) or scene_statistics(context)
+        ext = ".json" if self.file_format == 'JSON' else ".csv"
+        filepath = self.filepath
+        if os.path.splitext(filepath)[1].lower() in (".csv", ".json"):
+            filepath = os.path.splitext(filepath)[0]
+        filepath = bpy.path.ensure_ext(filepath, ext)
+
+        if self.file_format == 'JSON':
+            with open(filepath, "w", encoding="utf-8") as f:
+                json.dump(stats, f, indent=2)
+        else:
+            with open(filepath, "w", encoding="utf-8", newline="") as f:
+                writer = csv.writer(f)
+                writer.writerow(("scope", "name") + STAT_FIELDS)
+                writer.writerow(("scene", context.scene.name) + tuple(stats["totals"][k] for k in STAT_FIELDS))
+                for scope, table in (("collection", stats["collections"]),
+                                     ("mesh", stats["meshes"]),
+                                     ("object", stats["objects"])):
+                    for name, entry in sorted(table.items(), key=lambda x: x[1]["tris"], reverse=True):
+                        writer.writerow((scope, name) + tuple(entry[k] for k in STAT_FIELDS))
+
+        self.report({'INFO'}, f"Saved {filepath}")
+        return {'FINISHED'}
+
+
+class UTILITIES_OT_save_profile_log(Operator):
+    bl_idname = "utilities.save_profile_log"
+    bl_label = "Save Timing Log"
+    bl_description = "Append the recorded operator timings to profile.log in the Blender config folder"
+
+    def execute(self, context):
+        if not Instrumentation.records:
+            self.report({'WARNING'}, "No operator timings recorded yet")
+            return {'CANCELLED'}
+        Instrumentation.write_log(Instrumentation.records)
+        self.report({'INFO'}, f"Saved {len(Instrumentation.records)} record(s) to {Instrumentation.log_path()}")
+        return {'FINISHED'}
+
+
+class UTILITIES_OT_clear_profile(Operator):
+    bl_idname = "utilities.clear_profile"
+    bl_label = "Clear Timings"
+
+    def execute(self, context):
+        Instrumentation.records.clear()
         return {'FINISHED'}
 
 
@@ -136,15 +505,28 @@ class UTILITIES_OT_shade(Operator):
     )
 
     def execute(self, context):
-        for obj in context.selected_objects:
-            if obj.type == 'MESH':
-                context.view_layer.objects.active = obj
-                if self.mode == 'FLAT':
-                    bpy.ops.object.shade_flat()
-                elif self.mode == 'SMOOTH':
-                    bpy.ops.object.shade_smooth()
-                elif self.mode == 'AUTO':
-                    bpy.ops.object.shade_auto_smooth()
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            return {'FINISHED'}
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        # Linked duplicates share one mesh, so write each mesh once.
+        meshes = {obj.data for obj in objects}
+        with Instrumentation.phase("faces"):
+            for mesh in meshes:
+                set_smooth(mesh, self.mode != 'FLAT')
+        Instrumentation.count("objects", len(objects))
+        Instrumentation.count("meshes", len(meshes))
+
+        with Instrumentation.phase("modifiers"):
+            if self.mode == 'AUTO':
+                if not apply_auto_smooth(context, objects):
+                    self.report({'WARNING'}, f"Could not add the {AUTO_SMOOTH_GROUP} modifier")
+            else:
+                for obj in objects:
+                    for mod in [m for m in obj.modifiers if is_auto_smooth(m)]:
+                        obj.modifiers.remove(mod)
         return {'FINISHED'}
 
 
@@ -163,6 +545,73 @@ class UTILITIES_OT_select_non_manifold(Operator):
         return {'FINISHED'}
 
 
+class UTILITIES_OT_scan_mesh_health(Operator):
+    bl_idname = "utilities.scan_mesh_health"
+    bl_label = "Scan Meshes"
+    bl_description = "Count non-manifold edges, loose verts, zero-area faces, flipped faces and duplicate faces per object"
+
+    def execute(self, context):
+        settings = context.scene.utilities_settings
+        source = context.selected_objects if settings.health_selected_only else context.scene.objects
+        objects = [obj for obj in source if obj.type == 'MESH']
+
+        results = {}
+        with Instrumentation.phase("scan"):
+            for obj in objects:
+                if obj.mode == 'EDIT':
+                    obj.update_from_editmode()
+                # Linked duplicates share one scan.
+                if obj.data.name not in results:
+                    results[obj.data.name] = mesh_health(obj.data)
+                    Instrumentation.count("faces", len(obj.data.polygons))
+        Instrumentation.count("objects", len(objects))
+
+        settings.health_results.clear()
+        totals = dict.fromkeys(HEALTH_FIELDS, 0)
+        for obj in sorted(objects, key=lambda o: o.name):
+            health = results[obj.data.name]
+            if not any(health.values()):
+                continue
+            item = settings.health_results.add()
+            item.name = obj.name
+            for field in HEALTH_FIELDS:
+                setattr(item, field, health[field])
+                totals[field] += health[field]
+        settings.health_index = 0
+
+        if settings.health_results:
+            self.report({'WARNING'}, f"{len(settings.health_results)} of {len(objects)} mesh(es) with problems: "
+                                     + ", ".join(f"{k.replace('_', ' ')} {v:,}" for k, v in totals.items() if v))
+        else:
+            self.report({'INFO'}, f"{len(objects)} mesh(es) scanned, no problems found")
+        return {'FINISHED'}
+
+
+class UTILITIES_OT_jump_to_object(Operator):
+    bl_idname = "utilities.jump_to_object"
+    bl_label = "Jump to Object"
+    bl_description = "Select the object, make it active and frame it in the viewport"
+
+    object_name: StringProperty()
+
+    def execute(self, context):
+        obj = context.scene.objects.get(self.object_name)
+        if obj is None:
+            self.report({'WARNING'}, f"Object not found: {self.object_name}")
+            return {'CANCELLED'}
+        if context.mode != 'OBJECT':
+            bpy.ops.object.mode_set(mode='OBJECT')
+
+        for other in context.selected_objects:
+            other.select_set(False)
+        obj.hide_set(False)
+        obj.select_set(True)
+        context.view_layer.objects.active = obj
+        if context.area and context.area.type == 'VIEW_3D':
+            bpy.ops.view3d.view_selected()
+        return {'FINISHED'}
+
+
 class UTILITIES_OT_select_near_vertices(Operator):
     bl_idname = "utilities.select_near_vertices"
     bl_label = "Select"
@@ -172,19 +621,41 @@ class UTILITIES_OT_select_near_vertices(Operator):
         return context.mode == 'EDIT_MESH' and bpy.context.tool_settings.mesh_select_mode[0]
 
     def execute(self, context):
-        dist = context.scene.utilities_settings.selection_distance
+        settings = context.scene.utilities_settings
+        dist = settings.selection_distance
         obj = context.active_object
 
         if obj and obj.type == 'MESH':
             bm = bmesh.from_edit_mesh(obj.data)
-            bm.verts.ensure_lookup_table()
-
-            selected_positions = [v.co.copy() for v in bm.verts if v.select]
-            for v in bm.verts:
-                if any((v.co - pos).length <= dist for pos in selected_positions):
-                    v.select_set(True)
-
-            bmesh.update_edit_mesh(obj.data)
+            verts = bm.verts
+            verts.ensure_lookup_table()
+
+            # Balanced KD-tree gives O(log N) range queries instead of
+            # comparing every vertex against every selected vertex.
+            with Instrumentation.phase("build_kdtree"):
+                kd = KDTree(len(verts))
+                for i, v in enumerate(verts):
+                    kd.insert(v.co, i)
+                kd.balance()
+            Instrumentation.count("verts", len(verts))
+
+            frontier = [i for i, v in enumerate(verts) if v.select]
+            query_start = time.perf_counter()
+            while frontier:
+                grown = []
+                for i in frontier:
+                    for _co, index, _dist in kd.find_range(verts[i].co, dist):
+                        v = verts[index]
+                        if not v.select:
+                            v.select_set(True)
+                            grown.append(index)
+                if not settings.grow_until_stable:
+                    break
+                frontier = grown
+            Instrumentation.add_phase("range_query", time.perf_counter() - query_start)
+
+            with Instrumentation.phase("update_edit_mesh"):
+                bmesh.update_edit_mesh(obj.data)
 
         return {'FINISHED'}
 
@@ -193,6 +664,14 @@ class UTILITIES_OT_select_near_vertices(Operator):
 #   Property Group
 # ------------------------------------------------------------------------
 
+class UtilitiesHealthItem(PropertyGroup):
+    non_manifold: IntProperty(name="Non-Manifold Edges")
+    loose_verts: IntProperty(name="Loose Verts")
+    zero_area: IntProperty(name="Zero-Area Faces")
+    flipped: IntProperty(name="Flipped Patches")
+    duplicates: IntProperty(name="Duplicate Faces")
+
+
 class UtilitiesSettings(PropertyGroup):
     selection_distance: FloatProperty(
         name="Distance",
@@ -201,6 +680,36 @@ class UtilitiesSettings(PropertyGroup):
         min=0.0,
         unit='LENGTH'
     )
+    grow_until_stable: BoolProperty(
+        name="Grow Until Stable",
+        description="Keep selecting vertices within range of newly selected ones until nothing changes",
+        default=False
+    )
+    budget_tris: IntProperty(
+        name="Triangles",
+        description="Triangle budget for the whole scene",
+        default=500000,
+        min=0
+    )
+    budget_materials: IntProperty(
+        name="Materials",
+        description="Budget for unique materials in the scene",
+        default=64,
+        min=0
+    )
+    budget_draw_calls: IntProperty(
+        name="Draw Calls",
+        description="Budget for estimated draw calls (one per used material slot per object)",
+        default=500,
+        min=0
+    )
+    health_selected_only: BoolProperty(
+        name="Selected Only",
+        description="Scan only the selected meshes instead of the whole scene",
+        default=False
+    )
+    health_results: CollectionProperty(type=UtilitiesHealthItem)
+    health_index: IntProperty()
 
 
 # ------------------------------------------------------------------------
@@ -230,6 +739,7 @@ class UTILITIES_PT_main_panel(Panel):
         row.operator("utilities.count_elements", text="Vertex", icon='VERTEXSEL').mode = 'VERT'
         row.operator("utilities.count_elements", text="Edge", icon='EDGESEL').mode = 'EDGE'
         row.operator("utilities.count_elements", text="Face", icon='FACESEL').mode = 'FACE'
+        row.operator("utilities.count_elements", text="Tris", icon='MOD_TRIANGULATE').mode = 'TRI'
 
         layout.operator("utilities.toggle_wireframe", icon='SHADING_WIRE')
         layout.operator("utilities.toggle_face_orientation", icon='ORIENTATION_NORMAL')
@@ -253,6 +763,119 @@ class UTILITIES_PT_main_panel(Panel):
         row.prop(settings, "selection_distance", text="Range")
         row.enabled = (mode == 'EDIT_MESH' and is_vert_mode)
         row.operator("utilities.select_near_vertices", icon='POINTCLOUD_DATA')
+        row = layout.row()
+        row.enabled = (mode == 'EDIT_MESH' and is_vert_mode)
+        row.prop(settings, "grow_until_stable")
+
+
+class UTILITIES_PT_scene_budget(Panel):
+    bl_label = "Scene Budget"
+    bl_idname = "UTILITIES_PT_scene_budget"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "DefaultCube"
+    bl_parent_id = "UTILITIES_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.utilities_settings
+        stats = _scene_stats.get(context.scene.name)
+
+        row = layout.row(align=True)
+        row.operator("utilities.scene_stats", icon='FILE_REFRESH')
+        row.operator("utilities.export_scene_stats", text="", icon='EXPORT')
+
+        col = layout.column(align=True)
+        for field, budget in (("tris", "budget_tris"),
+                              ("materials", "budget_materials"),
+                              ("draw_calls", "budget_draw_calls")):
+            row = col.row(align=True)
+            if stats:
+                value = stats["totals"][field]
+                limit = getattr(settings, budget)
+                row.label(text=f"{value:,} / {limit:,}", icon='CHECKMARK' if value <= limit else 'ERROR')
+            row.prop(settings, budget)
+
+        if stats and stats["collections"]:
+            box = layout.box()
+            box.label(text="Collections by Tris")
+            top = sorted(stats["collections"].items(), key=lambda x: x[1]["tris"], reverse=True)[:8]
+            for name, entry in top:
+                box.label(text=f"{name}: {entry['tris']:,} tris, {entry['draw_calls']} calls",
+                          icon='OUTLINER_COLLECTION')
+
+
+class UTILITIES_UL_mesh_health(UIList):
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(text=item.name, icon='OBJECT_DATAMODE')
+        issues = [(item.non_manifold, "NM"), (item.loose_verts, "Loose"), (item.zero_area, "Zero"),
+                  (item.flipped, "Flip"), (item.duplicates, "Dup")]
+        row.label(text="  ".join(f"{label} {value}" for value, label in issues if value))
+        row.operator("utilities.jump_to_object", text="", icon='RESTRICT_SELECT_OFF').object_name = item.name
+
+
+class UTILITIES_PT_mesh_health(Panel):
+    bl_label = "Mesh Health"
+    bl_idname = "UTILITIES_PT_mesh_health"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "DefaultCube"
+    bl_parent_id = "UTILITIES_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+        settings = context.scene.utilities_settings
+
+        row = layout.row(align=True)
+        row.operator("utilities.scan_mesh_health", icon='VIEWZOOM')
+        row.prop(settings, "health_selected_only")
+
+        if settings.health_results:
+            layout.template_list("UTILITIES_UL_mesh_health", "", settings, "health_results",
+                                 settings, "health_index", rows=5)
+            items = settings.health_results
+            if 0 <= settings.health_index < len(items):
+                item = items[settings.health_index]
+                col = layout.column(align=True)
+                for field in HEALTH_FIELDS:
+                    col.label(text=f"{item.bl_rna.properties[field].name}: {getattr(item, field):,}")
+
+
+class UTILITIES_PT_profiler(Panel):
+    bl_label = "Operator Timings"
+    bl_idname = "UTILITIES_PT_profiler"
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'UI'
+    bl_category = "DefaultCube"
+    bl_parent_id = "UTILITIES_PT_main_panel"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    def draw(self, context):
+        layout = self.layout
+
+        row = layout.row(align=True)
+        row.operator("utilities.save_profile_log", icon='FILE_TICK')
+        row.operator("utilities.clear_profile", text="", icon='TRASH')
+
+        if not Instrumentation.records:
+            layout.label(text="No operator runs recorded")
+            return
+
+        for record in list(reversed(Instrumentation.records))[:10]:
+            box = layout.box()
+            col = box.column(align=True)
+            col.label(text=f"{record.operator}: {record.seconds * 1000:.1f} ms  {record.result}", icon='TIME')
+            phases = {}
+            for name, seconds in record.phases:
+                key = name.split(":", 1)[0]
+                phases[key] = phases.get(key, 0.0) + seconds
+            for name, seconds in phases.items():
+                col.label(text=f"    {name}: {seconds * 1000:.1f} ms")
+            if record.counts:
+                col.label(text="    " + ", ".join(f"{k} {v:,}" for k, v in record.counts.items()))
 
 
 # ------------------------------------------------------------------------
@@ -263,24 +886,43 @@ classes = (
     UTILITIES_OT_open_preferences,
     UTILITIES_OT_toggle_console,
     UTILITIES_OT_count_elements,
+    UTILITIES_OT_scene_stats,
+    UTILITIES_OT_export_scene_stats,
+    UTILITIES_OT_save_profile_log,
+    UTILITIES_OT_clear_profile,
     UTILITIES_OT_toggle_wireframe,
     UTILITIES_OT_toggle_face_orientation,
     UTILITIES_OT_shade,
     UTILITIES_OT_select_non_manifold,
+    UTILITIES_OT_scan_mesh_health,
+    UTILITIES_OT_jump_to_object,
     UTILITIES_OT_select_near_vertices,
+    UtilitiesHealthItem,
     UtilitiesSettings,
+    UTILITIES_UL_mesh_health,
     UTILITIES_PT_main_panel,
+    UTILITIES_PT_scene_budget,
+    UTILITIES_PT_mesh_health,
+    UTILITIES_PT_profiler,
 )
 
 def register():
     for cls in classes:
         bpy.utils.register_class(cls)
     bpy.types.Scene.utilities_settings = PointerProperty(type=UtilitiesSettings)
+    bpy.app.handlers.depsgraph_update_post.append(count_cache_handler)
+    bpy.app.handlers.load_post.append(count_cache_load_handler)
 
 def unregister():
     for cls in reversed(classes):
         bpy.utils.unregister_class(cls)
     del bpy.types.Scene.utilities_settings
+    if count_cache_handler in bpy.app.handlers.depsgraph_update_post:
+        bpy.app.handlers.depsgraph_update_post.remove(count_cache_handler)
+    if count_cache_load_handler in bpy.app.handlers.load_post:
+        bpy.app.handlers.load_post.remove(count_cache_load_handler)
+    _object_counts.clear()
+    _mesh_counts.clear()
 
 if __name__ == "__main__":
     register()
@@ -0,0 +1,117 @@
+import bpy
+import json
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+import threading
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+MESSAGE_PREFIX = "@@DEFAULTCUBE "
+
+# ------------------------------------------------------------------------
+#   Helpers
+# ------------------------------------------------------------------------
+
+def default_worker_count():
+    return max(1, os.cpu_count() or 1)
+
+def split_evenly(items, count):
+    """Deal items round-robin into at most count non-empty chunks."""
+    count = max(1, min(count, len(items)))
+    return [items[i::count] for i in range(count)]
+
+def emit(**message):
+    """Send a message from a worker process back to the parent."""
+    print(MESSAGE_PREFIX + json.dumps(message), flush=True)
+
+def load_job(job_path):
+    with open(job_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# ------------------------------------------------------------------------
+#   Worker Pool
+# ------------------------------------------------------------------------
+
+class WorkerPool:
+    """Run a function of this addon in `blender --background` processes.
+
+    The current file is saved to a temporary snapshot that every worker opens.
+    Each worker calls `<module>.<function>(job_path)` with its own JSON job file
+    and reports back through emit(); poll() returns those messages.
+    """
+
+    def __init__(self, module, function, jobs):
+        self.module = module
+        self.function = function
+        self.jobs = jobs
+        self.processes = []
+        self.temp_dir = None
+        self._messages = queue.Queue()
+        self._threads = []
+
+    def start(self):
+        self.temp_dir = tempfile.mkdtemp(prefix="defaultcube_")
+        snapshot = os.path.join(self.temp_dir, "snapshot.blend")
+        bpy.ops.wm.save_as_mainfile(filepath=snapshot, copy=True, check_existing=False)
+
+        package = os.path.basename(PACKAGE_DIR)
+        for index, job in enumerate(self.jobs):
+            job_path = os.path.join(self.temp_dir, f"job_{index}.json")
+            with open(job_path, "w", encoding="utf-8") as f:
+                json.dump(job, f)
+
+            expr = (
+                "import sys, importlib; "
+                f"sys.path.insert(0, {os.path.dirname(PACKAGE_DIR)!r}); "
+                f"importlib.import_module({package + '.' + self.module!r}).{self.function}({job_path!r})"
+            )
+            process = subprocess.Popen(
+                [bpy.app.binary_path, "--background", "--factory-startup", snapshot, "--python-expr", expr],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
+            thread = threading.Thread(target=self._read_output, args=(process,), daemon=True)
+            thread.start()
+            self.processes.append(process)
+            self._threads.append(thread)
+
+    def _read_output(self, process):
+        for line in process.stdout:
+            if line.startswith(MESSAGE_PREFIX):
+                try:
+                    self._messages.put(json.loads(line[len(MESSAGE_PREFIX):]))
+                except ValueError:
+                    pass
+        process.stdout.close()
+
+    def poll(self):
+        messages = []
+        while True:
+            try:
+                messages.append(self._messages.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def running(self):
+        return any(p.poll() is None for p in self.processes) or any(t.is_alive() for t in self._threads)
+
+    def terminate(self):
+        for p in self.processes:
+            if p.poll() is None:
+                p.terminate()
+
+    def cleanup(self):
+        for p in self.processes:
+            try:
+                p.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                p.kill()
+        if self.temp_dir:
+            shutil.rmtree(self.temp_dir, ignore_errors=True)
+            self.temp_dir = None
@@ -7,16 +7,111 @@ bl_info = {
     "category": "3D View",
 }
 
-from . import Utilities
-from . import UVwrap
-from . import BatchFBX
+import bpy
+import importlib
+import time
 
-modules = [Utilities, UVwrap, BatchFBX]
+from . import Instrumentation
+
+# (module name, preference toggle). Modules are only imported once enabled.
+MODULES = (
+    ("Utilities", "enable_utilities"),
+    ("UVwrap", "enable_uvwrap"),
+    ("BatchFBX", "enable_batchfbx"),
+)
+
+# Currently registered modules, in registration order.
+modules = []
+
+# Seconds spent importing and registering each module, for the benchmark.
+startup_timings = {}
+
+def _preferences():
+    addon = bpy.context.preferences.addons.get(__name__)
+    return addon.preferences if addon else None
+
+def _loaded(name):
+    return next((m for m in modules if m.__name__.rpartition(".")[2] == name), None)
+
+def register_module(name):
+    start = time.perf_counter()
+    module = importlib.import_module(f".{name}", __name__)
+    imported = time.perf_counter()
+    Instrumentation.instrument(module.classes)
+    module.register()
+    startup_timings[name] = {
+        "import": imported - start,
+        "register": time.perf_counter() - imported,
+    }
+    modules.append(module)
+
+def unregister_module(module):
+    module.unregister()
+    modules.remove(module)
+
+def sync_modules():
+    """Register enabled modules and unregister disabled ones."""
+    prefs = _preferences()
+    for name, toggle in MODULES:
+        enabled = getattr(prefs, toggle) if prefs else True
+        module = _loaded(name)
+        if enabled and module is None:
+            register_module(name)
+        elif not enabled and module is not None:
+            unregister_module(module)
+
+def _update_modules(self, context):
+    sync_modules()
+
+class DefaultCubePreferences(bpy.types.AddonPreferences):
+    bl_idname = __name__
+
+    enable_utilities: bpy.props.BoolProperty(
+        name="Utilities",
+        description="Scene utilities, element counts and scene budget",
+        default=True,
+        update=_update_modules
+    )
+    enable_uvwrap: bpy.props.BoolProperty(
+        name="UVwrap",
+        description="World-scaled unwrapping",
+        default=True,
+        update=_update_modules
+    )
+    enable_batchfbx: bpy.props.BoolProperty(
+        name="BatchFBX",
+        description="Batch FBX export",
+        default=True,
+        update=_update_modules
+    )
+    enable_profiling: bpy.props.BoolProperty(
+        name="Profile Operators",
+        description="Capture a cProfile report for every operator run (slow, for bug reports)",
+        default=False
+    )
+    log_to_file: bpy.props.BoolProperty(
+        name="Write Timing Log",
+        description="Append every operator timing record to profile.log in the Blender config folder",
+        default=False
+    )
+
+    def draw(self, context):
+        layout = self.layout
+        layout.label(text="Modules")
+        row = layout.row(align=True)
+        for name, toggle in MODULES:
+            row.prop(self, toggle, toggle=True)
+            timing = startup_timings.get(name)
+            if timing and _loaded(name):
+                row.label(text=f"{(timing['import'] + timing['register']) * 1000:.0f} ms")
+        layout.prop(self, "enable_profiling")
+        layout.prop(self, "log_to_file")
 
 def register():
-    for m in modules:
-        m.register()
+    bpy.utils.register_class(DefaultCubePreferences)
+    sync_modules()
 
 def unregister():
-    for m in reversed(modules):
-        m.unregister()
+    for m in reversed(modules[:]):
+        unregister_module(m)
+    bpy.utils.unregister_class(DefaultCubePreferences)
@@ -0,0 +1,284 @@
+"""Headless benchmark for the DefaultCube addon.
+
+Run from the addon folder with:
+
+    blender --background --factory-startup --python benchmark.py -- --output results.json
+    blender --background --factory-startup --python benchmark.py -- --output new.json --compare results.json
+
+Options after "--":
+    --output PATH       where to write the JSON results (default: benchmark_results.json)
+    --compare PATH      earlier results to compare against; exits with code 1 on regressions
+    --threshold FLOAT   relative slowdown that counts as a regression (default: 0.2)
+    --quick             skip the largest sizes
+
+The addon's own startup cost (package import plus per-module import and
+register time) is reported as "addon.startup".
+"""
+
+import bpy
+import bmesh
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+FACE_COUNTS = (1_000, 10_000, 100_000, 1_000_000)
+OBJECT_COUNTS = (10, 100, 1000)
+QUICK_FACE_LIMIT = 100_000
+QUICK_OBJECT_LIMIT = 100
+
+# Differences below this many seconds are treated as noise when comparing.
+NOISE_FLOOR = 0.01
+
+
+# ------------------------------------------------------------------------
+#   Scene generation
+# ------------------------------------------------------------------------
+
+def clear_scene():
+    if bpy.context.mode != 'OBJECT':
+        bpy.ops.object.mode_set(mode='OBJECT')
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+
+def make_grid_object(name, faces, offset=(0.0, 0.0, 0.0)):
+    """Add a wavy quad grid with roughly `faces` faces to the scene."""
+    n = max(1, int(round(math.sqrt(faces))))
+    xs = np.linspace(-n * 0.05, n * 0.05, n + 1)
+    gx, gy = np.meshgrid(xs, xs)
+    gz = 0.5 * np.sin(gx * 3.0) * np.cos(gy * 3.0)
+    co = np.column_stack([gx.ravel(), gy.ravel(), gz.ravel()]).astype(np.float32)
+
+    idx = np.arange((n + 1) * (n + 1)).reshape(n + 1, n + 1)
+    quads = np.stack([idx[:-1, :-1], idx[:-1, 1:], idx[1:, 1:], idx[1:, :-1]], axis=-1).reshape(-1, 4)
+
+    mesh = bpy.data.meshes.new(name)
+    mesh.vertices.add(len(co))
+    mesh.vertices.foreach_set("co", co.ravel())
+    mesh.loops.add(quads.size)
+    mesh.loops.foreach_set("vertex_index", quads.ravel().astype(np.int32))
+    mesh.polygons.add(len(quads))
+    mesh.polygons.foreach_set("loop_start", np.arange(0, quads.size, 4, dtype=np.int32))
+    mesh.update(calc_edges=True)
+
+    obj = bpy.data.objects.new(name, mesh)
+    obj.location = offset
+    bpy.context.scene.collection.objects.link(obj)
+    return obj
+
+def make_grid_objects(count, faces=100):
+    side = max(1, int(math.ceil(math.sqrt(count))))
+    return [
+        make_grid_object(f"Bench_{i:04d}", faces, offset=((i % side) * 3.0, (i // side) * 3.0, 0.0))
+        for i in range(count)
+    ]
+
+def select_only(objects):
+    view_layer = bpy.context.view_layer
+    for obj in view_layer.objects:
+        obj.select_set(False)
+    for obj in objects:
+        obj.select_set(True)
+    view_layer.objects.active = objects[0] if objects else None
+
+
+# ------------------------------------------------------------------------
+#   Measurement
+# ------------------------------------------------------------------------
+
+def rss_mb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere.
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+def measure(fn, setup=None):
+    """Run fn twice and return wall time and memory peaks.
+
+    tracemalloc slows down every Python allocation, so the wall time comes
+    from an untraced run and the memory peak from a second, traced run.
+    setup, if given, restores the starting state before each run.
+    """
+    if setup is not None:
+        setup()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        fn()
+    seconds = time.perf_counter() - start
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            fn()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "seconds": round(seconds, 6),
+        "python_peak_mb": round(peak / (1024 * 1024), 3),
+        "process_peak_rss_mb": rss_mb(),
+    }
+
+
+# ------------------------------------------------------------------------
+#   Benchmarks
+# ------------------------------------------------------------------------
+
+def bench_unwrap(results, face_counts):
+    for faces in face_counts:
+        def setup():
+            clear_scene()
+            select_only([make_grid_object("Bench_Unwrap", faces)])
+
+        for method in ('WORLD_PROJECT', 'SMART_PROJECT', 'CONFORMAL'):
+            results[f"uvwrap.unwrap_base/{method}/faces={faces}"] = measure(
+                lambda: bpy.ops.uvwrap.unwrap_base(unwrap_method=method, scale=1.0), setup)
+
+def bench_select_near(results, face_counts):
+    for faces in face_counts:
+        clear_scene()
+        obj = make_grid_object("Bench_Select", faces)
+        select_only([obj])
+        bpy.ops.object.mode_set(mode='EDIT')
+        bpy.context.tool_settings.mesh_select_mode = (True, False, False)
+        bpy.context.scene.utilities_settings.selection_distance = 0.12
+
+        def setup():
+            # Select a seam running across the whole grid.
+            bpy.ops.mesh.select_all(action='DESELECT')
+            bm = bmesh.from_edit_mesh(obj.data)
+            for v in bm.verts:
+                v.select = abs(v.co.x) < 0.03
+            bmesh.update_edit_mesh(obj.data)
+
+        results[f"utilities.select_near_vertices/faces={faces}"] = measure(
+            lambda: bpy.ops.utilities.select_near_vertices(), setup)
+        bpy.ops.object.mode_set(mode='OBJECT')
+
+def bench_count_elements(results, object_counts):
+    for count in object_counts:
+        def setup():
+            # Fresh objects have new session_uids, so the count cache starts cold.
+            clear_scene()
+            make_grid_objects(count)
+
+        results[f"utilities.count_elements/cold/objects={count}"] = measure(
+            lambda: bpy.ops.utilities.count_elements(mode='FACE'), setup)
+        results[f"utilities.count_elements/warm/objects={count}"] = measure(
+            lambda: bpy.ops.utilities.count_elements(mode='FACE'))
+
+def bench_batchfbx(results, object_counts):
+    props = bpy.context.scene.batchfbx_props
+    for count in object_counts:
+        clear_scene()
+        objects = make_grid_objects(count)
+        select_only(objects)
+        with tempfile.TemporaryDirectory(prefix="defaultcube_bench_") as directory:
+            props.export_path = directory
+            props.export_mode = 'VRCHAT'
+            results[f"batchfbx.export/objects={count}"] = measure(lambda: bpy.ops.batchfbx.export())
+
+
+# ------------------------------------------------------------------------
+#   Comparison
+# ------------------------------------------------------------------------
+
+def compare(current, baseline, threshold):
+    """Print a comparison table and return the keys that regressed."""
+    regressions = []
+    print(f"\n{'benchmark':<60} {'before':>10} {'after':>10} {'change':>8}")
+    for key in sorted(current):
+        if key not in baseline:
+            continue
+        before = baseline[key]["seconds"]
+        after = current[key]["seconds"]
+        change = (after - before) / before if before > 0 else 0.0
+        flag = ""
+        if change > threshold and after - before > NOISE_FLOOR:
+            regressions.append(key)
+            flag = "  REGRESSION"
+        print(f"{key:<60} {before:>10.4f} {after:>10.4f} {change:>+7.0%}{flag}")
+    return regressions
+
+
+# ------------------------------------------------------------------------
+#   Entry point
+# ------------------------------------------------------------------------
+
+def parse_args():
+    argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = argparse.ArgumentParser(prog="benchmark.py")
+    parser.add_argument("--output", default="benchmark_results.json")
+    parser.add_argument("--compare")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    parser.add_argument("--quick", action="store_true")
+    return parser.parse_args(argv)
+
+def main():
+    args = parse_args()
+
+    sys.path.insert(0, os.path.dirname(PACKAGE_DIR))
+    start = time.perf_counter()
+    package = importlib.import_module(os.path.basename(PACKAGE_DIR))
+    imported = time.perf_counter()
+    package.register()
+    registered = time.perf_counter()
+
+    face_counts = [n for n in FACE_COUNTS if not args.quick or n <= QUICK_FACE_LIMIT]
+    object_counts = [n for n in OBJECT_COUNTS if not args.quick or n <= QUICK_OBJECT_LIMIT]
+
+    results = {
+        "addon.startup": {
+            "seconds": round(registered - start, 6),
+            "package_import": round(imported - start, 6),
+            "modules": {
+                name: {phase: round(seconds, 6) for phase, seconds in timing.items()}
+                for name, timing in package.startup_timings.items()
+            },
+        },
+    }
+    bench_unwrap(results, face_counts)
+    bench_select_near(results, face_counts)
+    bench_count_elements(results, object_counts)
+    bench_batchfbx(results, object_counts)
+
+    report = {
+        "blender": bpy.app.version_string,
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Wrote {len(results)} result(s) to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)["results"]
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) above {args.threshold:.0%}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()